@@ -5,297 +5,546 @@ Senior Full-Stack AI Engineer - Enterprise Ready
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
 from datetime import datetime
 import time
+import os
 import sys
-import json
-from pathlib import Path
+import re
+from types import SimpleNamespace
 from typing import Dict, Any, List, Tuple
 import warnings
-warnings.filterwarnings('ignore')
+from collections import deque
+from itertools import islice
+from functools import lru_cache
+from statistics import fmean
 
-# Add src directory to path for imports
-src_path = Path(__file__).parent
-sys.path.append(str(src_path))
+# Models pickled under another scikit-learn version still load and predict correctly;
+# silence only that warning (InconsistentVersionWarning, a UserWarning raised from
+# sklearn.base on unpickling). Installed at import rather than with catch_warnings,
+# which swaps the process-global filter list and is not safe with concurrent session
+# threads; re-adding an identical filter on each rerun replaces it in place.
+warnings.filterwarnings(
+    "ignore",
+    message=r"Trying to unpickle estimator",
+    category=UserWarning,
+    module=r"sklearn\.",
+)
 
-# Import our processor
+# Import our processor (`streamlit run src/app.py` already puts src/ on sys.path)
 try:
     from processor import TicketProcessor
-    processor = TicketProcessor()
-    MODELS_LOADED = processor.category_model is not None and processor.sentiment_model is not None
 except ImportError as e:
     st.error(f"❌ System initialization failed: {str(e)}")
-    MODELS_LOADED = False
+    TicketProcessor = None
+
+
+@st.cache_resource
+def get_processor() -> "TicketProcessor":
+    """Build the processor (and load its models) once per server process.
+    
+    Raises FileNotFoundError while the models are missing: exceptions are not
+    cached, so every rerun retries until `python src/model_train.py` has run."""
+    processor = TicketProcessor()
+    if processor.category_model is None or processor.sentiment_model is None:
+        raise FileNotFoundError("Trained models not found - run src/model_train.py")
+    return processor
+
+
+def loaded_processor():
+    """The shared processor, or None while it cannot be imported or its models are missing."""
+    if TicketProcessor is None:
+        return None
+    try:
+        return get_processor()
+    except FileNotFoundError:
+        return None
+
+
+# Load up front so a broken model file is reported here instead of mid-page
+try:
+    loaded_processor()
 except Exception as e:
     st.error(f"❌ Processor initialization failed: {str(e)}")
-    MODELS_LOADED = False
+    st.stop()
+
+# Per-language tables are imported lazily on first use
+from i18n import SUPPORTED_LANGUAGES, load_table, translate
+
+# Session history caps (bounded deques evict the oldest entry on append)
+MAX_HISTORY = 100
+MAX_PROCESSING_TIMES = 50
+# Per-field history columns aggregated by the sidebar and history summary
+HISTORY_COLUMNS = ('confidence', 'priority', 'needs_review')
+
+
+def tail(items: deque, n: int) -> List[Any]:
+    """Last `n` items of a deque in insertion order (deques do not support slicing)."""
+    window = list(islice(reversed(items), n))
+    window.reverse()
+    return window
+
+
+def recent(items: deque, n: int) -> List[Any]:
+    """Last `n` items newest-first, for order-free aggregates (mean, counts)."""
+    return list(islice(reversed(items), n))
+
+
+def count_recent(items: deque, n: int, value: Any) -> int:
+    """Occurrences of `value` among the last `n` items."""
+    return recent(items, n).count(value)
+
+# ============================================
+# GOVERNMENT THEME STYLES (static - built once at import)
+# ============================================
+_STYLE_HTML = """
+    <style>
+        /* UAE Government Colors - Professional Palette */
+        :root {
+            --uae-green: #008000;
+            --uae-green-dark: #006400;
+            --uae-green-light: #E8F5E8;
+            --uae-red: #DC2626;
+            --uae-red-light: #FEE2E2;
+            --uae-yellow: #F59E0B;
+            --uae-yellow-light: #FEF3C7;
+            --uae-blue: #2563EB;
+            --uae-blue-light: #DBEAFE;
+            --uae-gray: #6B7280;
+            --uae-gray-light: #F9FAFB;
+            --uae-white: #FFFFFF;
+        }
+        
+        /* Language-specific text direction */
+        .text-direction-rtl {
+            direction: rtl;
+            text-align: right;
+            font-family: 'Segoe UI', 'Arial', sans-serif;
+        }
+        
+        .text-direction-ltr {
+            direction: ltr;
+            text-align: left;
+        }
+        
+        /* Professional Government Header */
+        .gov-header {
+            background: linear-gradient(90deg, var(--uae-green) 0%, var(--uae-green-dark) 100%);
+            color: white;
+            padding: 1.5rem 2rem;
+            border-radius: 0 0 12px 12px;
+            margin: -1rem -2rem 2rem -2rem;
+            box-shadow: 0 4px 12px rgba(0, 128, 0, 0.15);
+        }
+        
+        /* Section Headers */
+        .section-header {
+            color: var(--uae-green-dark);
+            border-bottom: 3px solid var(--uae-green);
+            padding-bottom: 0.75rem;
+            margin-bottom: 1.5rem;
+            font-weight: 700;
+            font-size: 1.3rem;
+        }
+        
+        /* Priority Badges - Professional Design */
+        .priority-badge {
+            padding: 6px 16px;
+            border-radius: 20px;
+            font-weight: 700;
+            font-size: 0.85rem;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            display: inline-block;
+            margin: 4px;
+        }
+        
+        .priority-critical {
+            background: linear-gradient(135deg, #DC2626, #EF4444);
+            color: white;
+            animation: pulse-critical 2s infinite;
+        }
+        
+        .priority-high {
+            background: linear-gradient(135deg, #EA580C, #F97316);
+            color: white;
+        }
+        
+        .priority-medium {
+            background: linear-gradient(135deg, var(--uae-green), #10B981);
+            color: white;
+        }
+        
+        .priority-low {
+            background: linear-gradient(135deg, #3B82F6, #60A5FA);
+            color: white;
+        }
+        
+        @keyframes pulse-critical {
+            0% { box-shadow: 0 0 0 0 rgba(220, 38, 38, 0.4); }
+            70% { box-shadow: 0 0 0 10px rgba(220, 38, 38, 0); }
+            100% { box-shadow: 0 0 0 0 rgba(220, 38, 38, 0); }
+        }
+        
+        /* Confidence Indicators */
+        .confidence-high { color: #10B981; font-weight: 700; }
+        .confidence-medium { color: #F59E0B; font-weight: 700; }
+        .confidence-low { color: #DC2626; font-weight: 700; }
+        
+        /* Professional Government Cards */
+        .gov-card {
+            background: white;
+            border: 1px solid #E5E7EB;
+            border-radius: 10px;
+            padding: 1.5rem;
+            margin-bottom: 1.5rem;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+            transition: all 0.2s ease;
+        }
+        
+        .gov-card:hover {
+            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
+            border-color: var(--uae-green-light);
+        }
+        
+        /* Action Items */
+        .action-item {
+            background: var(--uae-green-light);
+            border-left: 4px solid var(--uae-green);
+            padding: 12px 16px;
+            margin: 8px 0;
+            border-radius: 6px;
+            display: flex;
+            align-items: center;
+            gap: 10px;
+        }
+        
+        /* Status Indicators */
+        .status-indicator {
+            display: inline-flex;
+            align-items: center;
+            gap: 6px;
+            padding: 6px 12px;
+            border-radius: 20px;
+            font-size: 0.85rem;
+            font-weight: 600;
+        }
+        
+        .status-success { background: #D1FAE5; color: #065F46; }
+        .status-warning { background: #FEF3C7; color: #92400E; }
+        .status-error { background: #FEE2E2; color: #991B1B; }
+        .status-info { background: #DBEAFE; color: #1E40AF; }
+        
+        /* Button Styling */
+        .stButton button {
+            background: linear-gradient(135deg, var(--uae-green), var(--uae-green-dark));
+            color: white;
+            border: none;
+            border-radius: 8px;
+            font-weight: 600;
+            padding: 12px 24px;
+            transition: all 0.2s ease;
+        }
+        
+        .stButton button:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 4px 12px rgba(0, 128, 0, 0.2);
+        }
+        
+        /* Text Area Styling */
+        .stTextArea textarea {
+            font-size: 16px;
+            line-height: 1.5;
+            border: 2px solid #E5E7EB;
+            border-radius: 8px;
+            padding: 12px;
+        }
+        
+        .stTextArea textarea:focus {
+            border-color: var(--uae-green);
+            box-shadow: 0 0 0 3px rgba(0, 128, 0, 0.1);
+        }
+        
+        /* Example Ticket Buttons */
+        .example-ticket-btn {
+            background: white;
+            border: 2px solid var(--uae-green-light);
+            color: var(--uae-green-dark);
+            padding: 1rem;
+            border-radius: 10px;
+            text-align: center;
+            font-weight: 600;
+            font-size: 0.95rem;
+            transition: all 0.2s ease;
+            cursor: pointer;
+        }
+        
+        .example-ticket-btn:hover {
+            background: var(--uae-green-light);
+            border-color: var(--uae-green);
+            transform: translateY(-2px);
+        }
+        
+        /* Footer Styling */
+        .gov-footer {
+            background: var(--uae-gray-light);
+            padding: 1.5rem;
+            border-radius: 10px;
+            margin-top: 3rem;
+            border-top: 3px solid var(--uae-green-light);
+        }
+    </style>
+    """
+
+# Streamlit drops any element a rerun does not re-emit, so the stylesheet must be sent on
+# every rerun; strip comments and indentation once so each rerun sends the smallest payload.
+_STYLE_HTML = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", _STYLE_HTML, flags=re.S)).strip()
+
+# Text-direction CSS class per UI language
+_DIRECTION_CLASS = {'ar': 'text-direction-rtl', 'en': 'text-direction-ltr'}
+
+@lru_cache(maxsize=4)
+def _render_header_html(lang: str, title: str, subtitle: str, system_label: str) -> str:
+    """Header HTML for a language, rendered once per distinct set of labels."""
+    return f"""
+        <div class="gov-header {_DIRECTION_CLASS[lang]}">
+            <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 1rem;">
+                <div style="display: flex; align-items: center; gap: 1rem;">
+                    <div style="font-size: 2.5rem;">🏛️</div>
+                    <div>
+                        <h1 style="margin: 0; font-size: 2rem;">{title}</h1>
+                        <p style="margin: 0; opacity: 0.9; font-size: 1rem;">{subtitle}</p>
+                    </div>
+                </div>
+                <div style="display: flex; align-items: center; gap: 0.5rem;">
+                    <div style="background: rgba(255, 255, 255, 0.2); padding: 8px 16px; border-radius: 20px; font-weight: 600;">
+                        {system_label}
+                    </div>
+                    <div style="font-size: 2rem;">🇦🇪</div>
+                </div>
+            </div>
+        </div>
+        """
+
+@lru_cache(maxsize=len(SUPPORTED_LANGUAGES))
+def _render_footer_html(lang: str) -> str:
+    """Footer HTML for a language; it has no dynamic content, so it is built once."""
+    table = load_table(lang)
+    return f"""
+        <div class="gov-footer {_DIRECTION_CLASS[lang]}">
+            <div style="text-align: center;">
+                <div style="display: flex; justify-content: center; gap: 1rem; margin-bottom: 1rem; font-size: 1.5rem;">
+                    <span>🏛️</span>
+                    <span>🤖</span>
+                    <span>🇦🇪</span>
+                </div>
+                <p style="color: var(--uae-green-dark); font-weight: 700; margin-bottom: 0.5rem;">
+                    {table['footer_title']}
+                </p>
+                <p style="color: var(--uae-gray); font-size: 0.9rem; margin-bottom: 0.5rem;">
+                    {table['footer_subtitle']} • Python 3.12.7 • Streamlit 1.31.0
+                </p>
+                <p style="color: var(--uae-gray); font-size: 0.8rem;">
+                    {table['footer_copyright']} • All Rights Reserved
+                </p>
+            </div>
+        </div>
+        """
+
+@lru_cache(maxsize=len(SUPPORTED_LANGUAGES))
+def _review_status_html(lang: str) -> Dict[bool, str]:
+    """Manual-review / auto-processing status badges for a language, keyed by needs_review."""
+    table = load_table(lang)
+    return {
+        True: f'<div class="status-error status-indicator">⚠️ {table["results_manual_review"]}</div>',
+        False: f'<div class="status-success status-indicator">✅ {table["results_auto_processing"]}</div>',
+    }
+
+_NEUTRAL_SENTIMENT = ('😐', 'Neutral', 'gray')
+
+@lru_cache(maxsize=len(SUPPORTED_LANGUAGES))
+def _sentiment_display(lang: str) -> Dict[str, Tuple[str, str, str]]:
+    """(icon, label, markdown colour) per sentiment for a language."""
+    table = load_table(lang)
+    return {
+        'Positive': ('😊', table['results_positive_feedback'], 'green'),
+        'Neutral': _NEUTRAL_SENTIMENT,
+        'Negative': ('😠', table['results_dissatisfaction'], 'red')
+    }
 
 # ============================================
 # COMPLETE TRANSLATION SYSTEM WITH FIXED t() METHOD
 # ============================================
 class UAEGovernmentTranslator:
-    """Complete bilingual translation system for UAE Government."""
+    """Complete bilingual translation system for UAE Government.
     
-    TRANSLATIONS = {
-        "en": {
-            # Application
-            "app_title": "UAE Government AI Ticket Triage System",
-            "app_subtitle": "Ministry of Artificial Intelligence • Secure Platform",
-            
-            # Navigation
-            "tab_analyze": "📝 Ticket Analysis",
-            "tab_history": "📚 Ticket History",
-            
-            # Sidebar
-            "sidebar_system": "System Controls",
-            "sidebar_language": "Language Selection",
-            "sidebar_threshold": "Confidence Threshold",
-            "sidebar_threshold_help": "Minimum confidence for automatic processing",
-            "sidebar_user_role": "User Role",
-            "sidebar_analyst": "Analyst",
-            "sidebar_supervisor": "Supervisor",
-            "sidebar_admin": "Administrator",
-            "sidebar_stats": "System Statistics",
-            "sidebar_processed": "Tickets Processed",
-            "sidebar_accuracy": "Average Confidence",
-            "sidebar_actions": "System Actions",
-            "sidebar_clear": "🔄 Clear History",
-            "sidebar_view_logs": "📊 View Audit Logs",
-            "sidebar_status": "System Status",
-            "sidebar_ai_models": "AI Models",
-            "sidebar_security": "Security",
-            "sidebar_pii": "PII Protection",
-            "sidebar_audit": "Audit Logging",
-            
-            # Ticket Input
-            "section_examples": "Example Tickets",
-            "section_input": "Enter Ticket Details",
-            "example_select": "Select an example ticket:",
-            "input_label": "Ticket Text",
-            "input_placeholder": "Enter detailed ticket description...",
-            "btn_analyze": "🔍 Analyze Ticket",
-            "btn_clear": "🧹 Clear Input",
-            "input_stats": "Characters: {} | Words: {}",
-            
-            # Example Tickets
-            "example_emergency": "🚨 Emergency Case",
-            "example_emergency_desc": "Critical safety issue requiring immediate attention",
-            "example_technical": "💻 Technical Issue",
-            "example_technical_desc": "Government portal technical issue",
-            "example_billing": "💰 Billing Problem",
-            "example_billing_desc": "Citizen billing discrepancy investigation",
-            "example_facilities": "🏢 Facilities Request",
-            "example_facilities_desc": "Government building maintenance request",
-            "example_inquiry": "📋 Service Inquiry",
-            "example_inquiry_desc": "Citizen service request for documents",
-            
-            # Analysis Results
-            "results_title": "Ticket Analysis Results",
-            "results_ticket_id": "Ticket ID",
-            "results_priority": "Priority Level",
-            "results_response_time": "Response Time",
-            "results_department": "Department",
-            "results_confidence": "AI Confidence",
-            "results_confidence_high": "High Confidence",
-            "results_confidence_medium": "Medium Confidence",
-            "results_confidence_low": "Low Confidence",
-            "results_sentiment": "Citizen Sentiment",
-            "results_category": "Category",
-            "results_manual_review": "Manual Review Required",
-            "results_auto_processing": "Auto-Processing Approved",
-            "results_dissatisfaction": "Citizen Dissatisfaction Detected",
-            "results_positive_feedback": "Positive Feedback Received",
-            
-            # Department
-            "dept_assignment": "Department Assignment",
-            "dept_supervisor": "Supervisor",
-            "dept_contact": "Contact Information",
-            "dept_phone": "Phone",
-            "dept_email": "Email",
-            "dept_action_required": "Action Required",
-            
-            # Actions
-            "actions_title": "Required Actions",
-            "action_emergency": "🚨 Activate emergency response protocol",
-            "action_technical": "💻 Assign to IT support team",
-            "action_billing": "💰 Forward to finance department",
-            "action_facilities": "🔧 Assign maintenance team",
-            "action_inquiry": "📞 Contact citizen for clarification",
-            "action_standard": "Standard processing queue",
-            
-            # History Table
-            "history_title": "Ticket History",
-            "history_time": "Time",
-            "history_ticket_id": "Ticket ID",
-            "history_category": "Category",
-            "history_priority": "Priority",
-            "history_status": "Status",
-            "history_ai_action": "AI Suggested Action",
-            "history_no_data": "No ticket history available",
-            "history_summary": "History Summary",
-            "history_total": "Total Tickets",
-            "history_avg_conf": "Average Confidence",
-            "history_critical": "Critical Cases",
-            "history_manual": "Manual Reviews",
-            
-            # Status Messages
-            "status_processing": "Analyzing ticket with AI models...",
-            "status_complete": "Analysis complete!",
-            "status_error_empty": "Please enter ticket text",
-            "status_error_models": "AI models not loaded. Please train models first.",
-            "status_success": "Ticket processed successfully",
-            
-            # Footer
-            "footer_title": "UAE Ministry of Artificial Intelligence",
-            "footer_subtitle": "Smart Government Initiative • Secure Production",
-            "footer_copyright": "© 2024 United Arab Emirates Government",
-        },
-        
-        "ar": {
-            # Application
-            "app_title": "نظام تصنيف التذاكر الحكومي بالذكاء الاصطناعي",
-            "app_subtitle": "وزارة الذكاء الاصطناعي • منصة آمنة",
-            
-            # Navigation
-            "tab_analyze": "📝 تحليل التذاكر",
-            "tab_history": "📚 سجل التذاكر",
-            
-            # Sidebar
-            "sidebar_system": "عناصر تحكم النظام",
-            "sidebar_language": "اختيار اللغة",
-            "sidebar_threshold": "حد الثقة",
-            "sidebar_threshold_help": "الحد الأدنى للثقة للمعالجة التلقائية",
-            "sidebar_user_role": "دور المستخدم",
-            "sidebar_analyst": "محلل",
-            "sidebar_supervisor": "مشرف",
-            "sidebar_admin": "مسؤول",
-            "sidebar_stats": "إحصائيات النظام",
-            "sidebar_processed": "التذاكر المعالجة",
-            "sidebar_accuracy": "متوسط الثقة",
-            "sidebar_actions": "إجراءات النظام",
-            "sidebar_clear": "🔄 مسح السجل",
-            "sidebar_view_logs": "📊 عرض سجلات التدقيق",
-            "sidebar_status": "حالة النظام",
-            "sidebar_ai_models": "نماذج الذكاء الاصطناعي",
-            "sidebar_security": "الأمان",
-            "sidebar_pii": "حماية المعلومات الشخصية",
-            "sidebar_audit": "تسجيل التدقيق",
-            
-            # Ticket Input
-            "section_examples": "تذاكر مثال",
-            "section_input": "أدخل تفاصيل التذكرة",
-            "example_select": "اختر تذكرة مثال:",
-            "input_label": "نص التذكرة",
-            "input_placeholder": "أدخل وصفاً مفصلاً للتذكرة...",
-            "btn_analyze": "🔍 تحليل التذكرة",
-            "btn_clear": "🧹 مسح المدخلات",
-            "input_stats": "الحروف: {} | الكلمات: {}",
-            
-            # Example Tickets
-            "example_emergency": "🚨 حالة طوارئ",
-            "example_emergency_desc": "مشكلة سلامة حرجة تتطلب اهتماماً فورياً",
-            "example_technical": "💻 مشكلة تقنية",
-            "example_technical_desc": "مشكلة تقنية في البوابة الحكومية",
-            "example_billing": "💰 مشكلة فاتورة",
-            "example_billing_desc": "تحقيق في تناقض فاتورة المواطن",
-            "example_facilities": "🏢 طلب مرافق",
-            "example_facilities_desc": "طلب صيانة مبنى حكومي",
-            "example_inquiry": "📋 استفسار خدمة",
-            "example_inquiry_desc": "طلب خدمة المواطن للوثائق",
-            
-            # Analysis Results
-            "results_title": "نتائج تحليل التذكرة",
-            "results_ticket_id": "رقم التذكرة",
-            "results_priority": "مستوى الأولوية",
-            "results_response_time": "وقت الاستجابة",
-            "results_department": "القسم",
-            "results_confidence": "ثقة الذكاء الاصطناعي",
-            "results_confidence_high": "ثقة عالية",
-            "results_confidence_medium": "ثقة متوسطة",
-            "results_confidence_low": "ثقة منخفضة",
-            "results_sentiment": "مشاعر المواطن",
-            "results_category": "الفئة",
-            "results_manual_review": "مراجعة يدوية مطلوبة",
-            "results_auto_processing": "تمت الموافقة على المعالجة التلقائية",
-            "results_dissatisfaction": "تم اكتشاف عدم رضا المواطن",
-            "results_positive_feedback": "تم استقبال تعليقات إيجابية",
-            
-            # Department
-            "dept_assignment": "تعيين القسم",
-            "dept_supervisor": "المشرف",
-            "dept_contact": "معلومات الاتصال",
-            "dept_phone": "الهاتف",
-            "dept_email": "البريد الإلكتروني",
-            "dept_action_required": "إجراء مطلوب",
-            
-            # Actions
-            "actions_title": "الإجراءات المطلوبة",
-            "action_emergency": "🚨 تفعيل بروتوكول الاستجابة للطوارئ",
-            "action_technical": "💻 تعيين لفريق الدعم التقني",
-            "action_billing": "💰 تحويل لقسم المالية",
-            "action_facilities": "🔧 تعيين لفريق الصيانة",
-            "action_inquiry": "📞 التواصل مع المواطن للتوضيح",
-            "action_standard": "طابور المعالجة القياسي",
-            
-            # History Table
-            "history_title": "سجل التذاكر",
-            "history_time": "الوقت",
-            "history_ticket_id": "رقم التذكرة",
-            "history_category": "الفئة",
-            "history_priority": "الأولوية",
-            "history_status": "الحالة",
-            "history_ai_action": "الإجراء المقترح من الذكاء الاصطناعي",
-            "history_no_data": "لا يوجد سجل تذاكر متاح",
-            "history_summary": "ملخص السجل",
-            "history_total": "إجمالي التذاكر",
-            "history_avg_conf": "متوسط الثقة",
-            "history_critical": "الحالات الحرجة",
-            "history_manual": "المراجعات اليدوية",
-            
-            # Status Messages
-            "status_processing": "جاري تحليل التذكرة بنماذج الذكاء الاصطناعي...",
-            "status_complete": "اكتمل التحليل!",
-            "status_error_empty": "الرجاء إدخال نص التذكرة",
-            "status_error_models": "لم يتم تحميل نماذج الذكاء الاصطناعي. الرجاء تدريب النماذج أولاً.",
-            "status_success": "تم معالجة التذكرة بنجاح",
-            
-            # Footer
-            "footer_title": "وزارة الذكاء الاصطناعي في الإمارات",
-            "footer_subtitle": "مبادرة الحكومة الذكية • إنتاج آمن",
-            "footer_copyright": "© 2024 حكومة الإمارات العربية المتحدة",
-        }
-    }
+    Thin facade over the i18n tables; instances are shared per language via
+    get_translator(), so they are read-only - ask get_translator() for another
+    language instead of re-targeting an instance."""
     
-    def __init__(self, language: str = "en"):
-        self.language = language
+    __slots__ = ("language", "_table", "t")
     
+    def __init__(self, language: str = "en"):
+        """Bind the language's translation table.
+        
+        `t` is bound to the table's C-level __getitem__ (missing keys fall back
+        to the key), so every label lookup skips the Python call frame."""
+        language = language if language in SUPPORTED_LANGUAGES else "en"
+        object.__setattr__(self, "language", language)
+        object.__setattr__(self, "_table", load_table(language))
+        object.__setattr__(self, "t", self._table.__getitem__)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is read-only; use get_translator(language)")
+
     def translate(self, key: str) -> str:
-        """Translate a key to current language."""
-        return self.TRANSLATIONS.get(self.language, {}).get(key, key)
+        """Translate a key to current language (single lookup in the bound table)."""
+        return self._table[key]
+
+@st.cache_resource(show_spinner=False)
+def get_translator(language: str) -> UAEGovernmentTranslator:
+    """One translator per language, built once and reused by every session."""
+    return UAEGovernmentTranslator(language)
+
+@st.cache_resource(show_spinner=False)
+def labels_for(language: str) -> SimpleNamespace:
+    """All UI strings for a language as attributes, built once per language."""
+    return SimpleNamespace(**load_table(language))
+
+# History table column widths, keyed by label
+_HISTORY_COLUMN_WIDTHS = (
+    ('history_time', "small"),
+    ('history_ticket_id', "medium"),
+    ('history_category', "medium"),
+    ('history_priority', "small"),
+    ('history_status', "small"),
+    ('history_ai_action', "large"),
+)
+
+@lru_cache(maxsize=len(SUPPORTED_LANGUAGES))
+def history_column_config(language: str) -> Dict[str, Any]:
+    """st.dataframe column_config for the history table, built once per language."""
+    table = load_table(language)
+    return {
+        table[key]: st.column_config.TextColumn(table[key], width=width)
+        for key, width in _HISTORY_COLUMN_WIDTHS
+    }
+
+# Static example skeletons; titles/descriptions are translated per language in build_examples()
+_EXAMPLES_RAW = (
+    {
+        "title_key": "example_emergency",
+        "desc_key": "example_emergency_desc",
+        "text_en": "URGENT: Fire alarm system malfunction at Ministry of AI building, Dubai Internet City. Multiple floors affected. People reporting smoke smell. Emirates ID: 784-1990-1234567-1. Contact: +971501234567. Need immediate emergency response team deployment.",
+        "text_ar": "عاجل: عطل في نظام إنذار الحريق في مبنى وزارة الذكاء الاصطناعي، دبي إنترنت سيتي. طوابق متعددة متأثرة. أشخاص يبلغون عن رائحة دخان. رقم الهوية: 784-1990-1234567-1. الاتصال: +971501234567. يحتاج إلى نشر فريق الاستجابة للطوارئ فوراً."
+    },
+    {
+        "title_key": "example_technical",
+        "desc_key": "example_technical_desc",
+        "text_en": "DEWA online payment portal not working since 9:00 AM. Users receiving 'Error 500: Internal Server Error' when trying to pay bills. Issue affecting all customers in Dubai area. Need urgent technical team intervention to restore service.",
+        "text_ar": "بوابة الدفع الإلكتروني لهيئة كهرباء ومياه دبي لا تعمل منذ الساعة 9:00 صباحاً. المستخدمون يتلقون 'خطأ 500: خطأ في الخادم الداخلي' عند محاولة دفع الفواتير. المشكلة تؤثر على جميع العملاء في منطقة دبي. يحتاج إلى تدخل فوري من الفريق التقني لاستعادة الخدمة."
+    },
+    {
+        "title_key": "example_billing",
+        "desc_key": "example_billing_desc",
+        "text_en": "Incorrect charges on Etisalat invoice for November 2024. Bill shows 750 AED for international calls to USA, but no international calls were made from my number +971501234567. Need detailed call logs and immediate correction of charges.",
+        "text_ar": "رسوم غير صحيحة على فاتورة اتصالات لشهر نوفمبر 2024. الفاتورة تظهر 750 درهماً لمكالمات دولية إلى الولايات المتحدة، ولكن لم تجر أي مكالمات دولية من رقمي +971501234567. يحتاج إلى سجلات مكالمات مفصلة وتصحيح فوري للرسوم."
+    },
+    {
+        "title_key": "example_facilities",
+        "desc_key": "example_facilities_desc",
+        "text_en": "Air conditioning system malfunction in Dubai Government Customer Happiness Center, Al Barsha. Temperature reading 30°C inside building, causing discomfort for visitors and staff. Urgent maintenance required. Building ID: DXB-GOV-0456.",
+        "text_ar": "عطل في نظام التكييف في مركز سعادة المتعاملين الحكومي بدبي، البرشاء. قراءة درجة الحرارة 30° مئوية داخل المبنى، مما يسبب عدم راحة للزوار والموظفين. يحتاج إلى صيانة عاجلة. رقم المبنى: DXB-GOV-0456."
+    },
+    {
+        "title_key": "example_inquiry",
+        "desc_key": "example_inquiry_desc",
+        "text_en": "Need to inquire about Emirates ID renewal process for family of 4. What documents are required? What is the processing time? My Emirates ID: 784-1995-5678901-5. Please provide step-by-step guidance and appointment scheduling options.",
+        "text_ar": "أحتاج إلى الاستفسار عن عملية تجديد هوية الإمارات لعائلة مكونة من 4 أفراد. ما هي المستندات المطلوبة؟ ما هو وقت المعالجة؟ رقم هوية الإمارات الخاصة بي: 784-1995-5678901-5. يرجى تقديم إرشادات خطوة بخطوة وخيارات جدولة المواعيد."
+    }
+)
+
+@st.cache_data(show_spinner=False)
+def build_examples(language: str) -> List[Dict[str, str]]:
+    """Build translated example tickets once per language (cached across reruns and sessions).
     
-    def t(self, key: str) -> str:
-        """Shortcut method for translation (FIXED)."""
-        return self.translate(key)
+    Only the fields the UI reads are kept, since st.cache_data hands every
+    rerun its own copy of the cached value."""
+    text_field = "text_ar" if language == "ar" else "text_en"
+    return [
+        {
+            "title_key": example["title_key"],
+            "title": translate(example["title_key"], language),
+            "description": translate(example["desc_key"], language),
+            "text": example[text_field],
+        }
+        for example in _EXAMPLES_RAW
+    ]
+
+@lru_cache(maxsize=8)
+def text_stats(text: str) -> Tuple[int, int]:
+    """Character and word counts for the input caption, cached on the last few text snapshots.
     
-    def set_language(self, language: str):
-        """Set language and update CSS."""
-        if language in ["en", "ar"]:
-            self.language = language
+    A plain in-process lru_cache: st.cache_data would hash and pickle on every rerun."""
+    return len(text), len(text.split())
+
+def summarize_history(columns: Dict[str, deque], n: int) -> Tuple[int, float, int, int]:
+    """Count, mean confidence, critical and manual-review totals over the last `n` tickets."""
+    confidences = recent(columns['confidence'], n)
+    total = len(confidences)
+    if not total:
+        return 0, 0.0, 0, 0
+    critical = count_recent(columns['priority'], n, 'Critical')
+    manual = count_recent(columns['needs_review'], n, True)
+    return total, fmean(confidences), critical, manual
+
+# History table display values
+PRIORITY_ICONS = {'Critical': '🔴', 'High': '🟠', 'Medium': '🟢', 'Low': '🔵'}
+REVIEW_STATUS = {True: "⚠️ Manual", False: "✅ Auto"}
+
+# Suggested-action translation keys by category (Critical priority always escalates)
+_CATEGORY_ACTIONS = {
+    'Technical / IT': 'action_technical',
+    'Billing': 'action_billing',
+    'Facilities': 'action_facilities',
+    'Inquiry': 'action_inquiry',
+}
+
+@lru_cache(maxsize=64)
+def action_key(priority: str, category: str, sentiment: str) -> str:
+    """Resolve the suggested-action translation key for a decision triple."""
+    if priority == 'Critical':
+        return 'action_emergency'
+    key = _CATEGORY_ACTIONS.get(category)
+    if key:
+        return key
+    # Contact the citizen for negative sentiment
+    return 'action_inquiry' if sentiment == 'Negative' else 'action_standard'
 
 # ============================================
 # UAE GOVERNMENT TICKET SYSTEM - FIXED VERSION
 # ============================================
 class UAEGovTicketSystem:
-    """UAE Government AI Ticket Triage System - Fully Fixed Version."""
+    """UAE Government AI Ticket Triage System - Fully Fixed Version.
     
-    def __init__(self):
-        """Initialize system with proper state management."""
-        self.processor = processor if MODELS_LOADED else None
-        self.translator = UAEGovernmentTranslator("en")
-        self._init_session_state()
+    Built once per server process (see get_app) and shared by every session, so it
+    holds no per-user state: that lives in st.session_state. The processor and the
+    translators it reaches are shared too and are never mutated per user - the
+    review threshold is passed on each process_text call, and translators are
+    read-only instances looked up per language."""
+    
+    @property
+    def processor(self):
+        """Shared processor (None until the models load), resolved on every run.
+        
+        This instance outlives the run that built it, so it asks get_processor each
+        time instead of keeping a result; models trained after startup are picked up
+        on the next rerun."""
+        return loaded_processor()
+    
+    @property
+    def translator(self) -> UAEGovernmentTranslator:
+        """Shared per-language translator for the current session's language."""
+        return get_translator(st.session_state.language)
     
     def _init_session_state(self):
         """Initialize session state with complete UI state."""
@@ -305,13 +554,16 @@ class UAEGovTicketSystem:
         
         # Ticket data
         if 'ticket_history' not in st.session_state:
-            st.session_state.ticket_history = []
+            st.session_state.ticket_history = deque(maxlen=MAX_HISTORY)
+        if 'history_columns' not in st.session_state:
+            # Column-wise copy of the aggregated fields, kept in lockstep with ticket_history
+            st.session_state.history_columns = {name: deque(maxlen=MAX_HISTORY) for name in HISTORY_COLUMNS}
         if 'current_result' not in st.session_state:
             st.session_state.current_result = None
         if 'ticket_text' not in st.session_state:
             st.session_state.ticket_text = ""
         if 'processing_times' not in st.session_state:
-            st.session_state.processing_times = []
+            st.session_state.processing_times = deque(maxlen=MAX_PROCESSING_TIMES)
         
         # System configuration
         if 'confidence_threshold' not in st.session_state:
@@ -320,283 +572,61 @@ class UAEGovTicketSystem:
             st.session_state.selected_example = None
         if 'processing_in_progress' not in st.session_state:
             st.session_state.processing_in_progress = False
-        
-        # Update translator
-        self.translator.set_language(st.session_state.language)
     
     def _apply_styles(self):
         """Apply CSS styles with RTL/LTR support and professional design."""
-        css = f"""
-        <style>
-            /* UAE Government Colors - Professional Palette */
-            :root {{
-                --uae-green: #008000;
-                --uae-green-dark: #006400;
-                --uae-green-light: #E8F5E8;
-                --uae-red: #DC2626;
-                --uae-red-light: #FEE2E2;
-                --uae-yellow: #F59E0B;
-                --uae-yellow-light: #FEF3C7;
-                --uae-blue: #2563EB;
-                --uae-blue-light: #DBEAFE;
-                --uae-gray: #6B7280;
-                --uae-gray-light: #F9FAFB;
-                --uae-white: #FFFFFF;
-            }}
-            
-            /* Language-specific text direction */
-            .text-direction-rtl {{
-                direction: rtl;
-                text-align: right;
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-            }}
-            
-            .text-direction-ltr {{
-                direction: ltr;
-                text-align: left;
-            }}
-            
-            /* Professional Government Header */
-            .gov-header {{
-                background: linear-gradient(90deg, var(--uae-green) 0%, var(--uae-green-dark) 100%);
-                color: white;
-                padding: 1.5rem 2rem;
-                border-radius: 0 0 12px 12px;
-                margin: -1rem -2rem 2rem -2rem;
-                box-shadow: 0 4px 12px rgba(0, 128, 0, 0.15);
-            }}
-            
-            /* Section Headers */
-            .section-header {{
-                color: var(--uae-green-dark);
-                border-bottom: 3px solid var(--uae-green);
-                padding-bottom: 0.75rem;
-                margin-bottom: 1.5rem;
-                font-weight: 700;
-                font-size: 1.3rem;
-            }}
-            
-            /* Priority Badges - Professional Design */
-            .priority-badge {{
-                padding: 6px 16px;
-                border-radius: 20px;
-                font-weight: 700;
-                font-size: 0.85rem;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                display: inline-block;
-                margin: 4px;
-            }}
-            
-            .priority-critical {{
-                background: linear-gradient(135deg, #DC2626, #EF4444);
-                color: white;
-                animation: pulse-critical 2s infinite;
-            }}
-            
-            .priority-high {{
-                background: linear-gradient(135deg, #EA580C, #F97316);
-                color: white;
-            }}
-            
-            .priority-medium {{
-                background: linear-gradient(135deg, var(--uae-green), #10B981);
-                color: white;
-            }}
-            
-            .priority-low {{
-                background: linear-gradient(135deg, #3B82F6, #60A5FA);
-                color: white;
-            }}
-            
-            @keyframes pulse-critical {{
-                0% {{ box-shadow: 0 0 0 0 rgba(220, 38, 38, 0.4); }}
-                70% {{ box-shadow: 0 0 0 10px rgba(220, 38, 38, 0); }}
-                100% {{ box-shadow: 0 0 0 0 rgba(220, 38, 38, 0); }}
-            }}
-            
-            /* Confidence Indicators */
-            .confidence-high {{ color: #10B981; font-weight: 700; }}
-            .confidence-medium {{ color: #F59E0B; font-weight: 700; }}
-            .confidence-low {{ color: #DC2626; font-weight: 700; }}
-            
-            /* Professional Government Cards */
-            .gov-card {{
-                background: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 10px;
-                padding: 1.5rem;
-                margin-bottom: 1.5rem;
-                box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-                transition: all 0.2s ease;
-            }}
-            
-            .gov-card:hover {{
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-                border-color: var(--uae-green-light);
-            }}
-            
-            /* Action Items */
-            .action-item {{
-                background: var(--uae-green-light);
-                border-left: 4px solid var(--uae-green);
-                padding: 12px 16px;
-                margin: 8px 0;
-                border-radius: 6px;
-                display: flex;
-                align-items: center;
-                gap: 10px;
-            }}
-            
-            /* Status Indicators */
-            .status-indicator {{
-                display: inline-flex;
-                align-items: center;
-                gap: 6px;
-                padding: 6px 12px;
-                border-radius: 20px;
-                font-size: 0.85rem;
-                font-weight: 600;
-            }}
-            
-            .status-success {{ background: #D1FAE5; color: #065F46; }}
-            .status-warning {{ background: #FEF3C7; color: #92400E; }}
-            .status-error {{ background: #FEE2E2; color: #991B1B; }}
-            .status-info {{ background: #DBEAFE; color: #1E40AF; }}
-            
-            /* Button Styling */
-            .stButton button {{
-                background: linear-gradient(135deg, var(--uae-green), var(--uae-green-dark));
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-weight: 600;
-                padding: 12px 24px;
-                transition: all 0.2s ease;
-            }}
-            
-            .stButton button:hover {{
-                transform: translateY(-2px);
-                box-shadow: 0 4px 12px rgba(0, 128, 0, 0.2);
-            }}
-            
-            /* Text Area Styling */
-            .stTextArea textarea {{
-                font-size: 16px;
-                line-height: 1.5;
-                border: 2px solid #E5E7EB;
-                border-radius: 8px;
-                padding: 12px;
-            }}
-            
-            .stTextArea textarea:focus {{
-                border-color: var(--uae-green);
-                box-shadow: 0 0 0 3px rgba(0, 128, 0, 0.1);
-            }}
-            
-            /* Example Ticket Buttons */
-            .example-ticket-btn {{
-                background: white;
-                border: 2px solid var(--uae-green-light);
-                color: var(--uae-green-dark);
-                padding: 1rem;
-                border-radius: 10px;
-                text-align: center;
-                font-weight: 600;
-                font-size: 0.95rem;
-                transition: all 0.2s ease;
-                cursor: pointer;
-            }}
-            
-            .example-ticket-btn:hover {{
-                background: var(--uae-green-light);
-                border-color: var(--uae-green);
-                transform: translateY(-2px);
-            }}
-            
-            /* Footer Styling */
-            .gov-footer {{
-                background: var(--uae-gray-light);
-                padding: 1.5rem;
-                border-radius: 10px;
-                margin-top: 3rem;
-                border-top: 3px solid var(--uae-green-light);
-            }}
-        </style>
-        """
-        
-        st.markdown(css, unsafe_allow_html=True)
+        st.markdown(_STYLE_HTML, unsafe_allow_html=True)
     
     def _display_header(self):
         """Display professional government header with language support."""
-        direction_class = "text-direction-rtl" if st.session_state.language == "ar" else "text-direction-ltr"
-        
-        st.markdown(f"""
-        <div class="gov-header {direction_class}">
-            <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 1rem;">
-                <div style="display: flex; align-items: center; gap: 1rem;">
-                    <div style="font-size: 2.5rem;">🏛️</div>
-                    <div>
-                        <h1 style="margin: 0; font-size: 2rem;">{self.translator.t('app_title')}</h1>
-                        <p style="margin: 0; opacity: 0.9; font-size: 1rem;">{self.translator.t('app_subtitle')}</p>
-                    </div>
-                </div>
-                <div style="display: flex; align-items: center; gap: 0.5rem;">
-                    <div style="background: rgba(255, 255, 255, 0.2); padding: 8px 16px; border-radius: 20px; font-weight: 600;">
-                        {self.translator.t('sidebar_system')}
-                    </div>
-                    <div style="font-size: 2rem;">🇦🇪</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        t = self.translator.t
+        st.markdown(_render_header_html(st.session_state.language, t('app_title'), t('app_subtitle'),
+                                        t('sidebar_system')), unsafe_allow_html=True)
     
     def _display_sidebar(self):
         """Display sidebar with system controls - Fixed layout."""
+        t = self.translator.t
         with st.sidebar:
             # Language Toggle
-            st.markdown(f"### 🌐 {self.translator.t('sidebar_language')}")
+            st.markdown(f"### 🌐 {t('sidebar_language')}")
             
             lang_col1, lang_col2 = st.columns(2)
             with lang_col1:
                 if st.button("🇦🇪 عربي", use_container_width=True,
                            type="primary" if st.session_state.language == "ar" else "secondary"):
                     st.session_state.language = "ar"
-                    self.translator.set_language("ar")
                     st.rerun()
             
             with lang_col2:
                 if st.button("🇺🇸 English", use_container_width=True,
                            type="primary" if st.session_state.language == "en" else "secondary"):
                     st.session_state.language = "en"
-                    self.translator.set_language("en")
                     st.rerun()
             
             st.divider()
             
             # Confidence Threshold
-            st.markdown(f"#### 📊 {self.translator.t('sidebar_threshold')}")
+            st.markdown(f"#### 📊 {t('sidebar_threshold')}")
             threshold = st.slider(
-                self.translator.t('sidebar_threshold'),
+                t('sidebar_threshold'),
                 min_value=0.0,
                 max_value=1.0,
                 value=st.session_state.confidence_threshold,
                 step=0.05,
-                help=self.translator.t('sidebar_threshold_help'),
+                help=t('sidebar_threshold_help'),
                 label_visibility="collapsed"
             )
             
-            if self.processor:
-                self.processor.confidence_threshold = threshold
+            # Per-session setting, passed to the shared processor on each call
             st.session_state.confidence_threshold = threshold
             
             # User Role
             st.selectbox(
-                self.translator.t('sidebar_user_role'),
+                t('sidebar_user_role'),
                 [
-                    self.translator.t('sidebar_analyst'),
-                    self.translator.t('sidebar_supervisor'),
-                    self.translator.t('sidebar_admin')
+                    t('sidebar_analyst'),
+                    t('sidebar_supervisor'),
+                    t('sidebar_admin')
                 ],
                 key="user_role_select"
             )
@@ -604,54 +634,61 @@ class UAEGovTicketSystem:
             st.divider()
             
             # System Statistics
-            st.markdown(f"### 📈 {self.translator.t('sidebar_stats')}")
+            st.markdown(f"### 📈 {t('sidebar_stats')}")
             
             stats_col1, stats_col2 = st.columns(2)
             with stats_col1:
                 total = len(st.session_state.ticket_history)
-                st.metric(self.translator.t('sidebar_processed'), total)
+                st.metric(t('sidebar_processed'), total)
             
             with stats_col2:
                 if total > 0:
-                    recent = st.session_state.ticket_history[-5:]
-                    avg_conf = np.mean([t.get('confidence', 0) for t in recent])
-                    st.metric(self.translator.t('sidebar_accuracy'), f"{avg_conf:.1%}")
+                    avg_conf = fmean(recent(st.session_state.history_columns['confidence'], 5))
+                    st.metric(t('sidebar_accuracy'), f"{avg_conf:.1%}")
                 else:
-                    st.metric(self.translator.t('sidebar_accuracy'), "N/A")
+                    st.metric(t('sidebar_accuracy'), "N/A")
             
             # Performance metrics
             if len(st.session_state.processing_times) > 0:
-                avg_time = np.mean(st.session_state.processing_times[-5:])
+                avg_time = fmean(recent(st.session_state.processing_times, 5))
                 st.info(f"⏱️ Avg Processing: {avg_time:.2f}s")
             
             # Critical cases alert
             if total > 0:
-                priorities = [t.get('priority', 'Medium') for t in st.session_state.ticket_history[-10:]]
-                critical = priorities.count('Critical')
+                critical = count_recent(st.session_state.history_columns['priority'], 10, 'Critical')
                 if critical > 0:
-                    st.warning(f"🚨 {critical} {self.translator.t('history_critical').lower()}")
+                    st.warning(f"🚨 {critical} {t('history_critical').lower()}")
             
             st.divider()
             
             # System Actions
-            st.markdown(f"### ⚡ {self.translator.t('sidebar_actions')}")
+            st.markdown(f"### ⚡ {t('sidebar_actions')}")
             
             action_col1, action_col2 = st.columns(2)
             with action_col1:
-                if st.button(self.translator.t('sidebar_clear'), use_container_width=True, type="secondary"):
-                    st.session_state.ticket_history = []
+                if st.button(t('sidebar_clear'), use_container_width=True, type="secondary"):
+                    st.session_state.ticket_history.clear()
+                    for column in st.session_state.history_columns.values():
+                        column.clear()
+                    # Freed entries may reuse ids, so drop the cached history frame's key
+                    st.session_state.pop('_history_df_key', None)
                     st.session_state.current_result = None
                     st.session_state.ticket_text = ""
-                    st.session_state.processing_times = []
+                    st.session_state.processing_times.clear()
                     st.rerun()
             
             with action_col2:
-                if st.button(self.translator.t('sidebar_view_logs'), use_container_width=True, type="secondary"):
+                if st.button(t('sidebar_view_logs'), use_container_width=True, type="secondary"):
                     try:
+                        from pathlib import Path  # only needed when the log viewer is opened
                         log_file = Path("../logs/system_audit.log")
                         if log_file.exists():
-                            with open(log_file, 'r') as f:
-                                logs = f.readlines()[-15:]
+                            # Read only the trailing window instead of the whole (growing) log
+                            with open(log_file, 'rb') as f:
+                                f.seek(0, os.SEEK_END)
+                                f.seek(max(0, f.tell() - 8192))
+                                log_tail = f.read().decode('utf-8', errors='replace')
+                            logs = log_tail.splitlines()[-15:]
                             with st.expander("🔍 Audit Logs", expanded=True):
                                 st.code("\n".join(logs), language="json")
                         else:
@@ -662,88 +699,47 @@ class UAEGovTicketSystem:
             st.divider()
             
             # System Status
-            st.markdown(f"### 🟢 {self.translator.t('sidebar_status')}")
+            st.markdown(f"### 🟢 {t('sidebar_status')}")
             
             status_col1, status_col2 = st.columns(2)
             with status_col1:
-                if MODELS_LOADED:
+                if self.processor is not None:
                     st.success("✅ AI Models")
                 else:
                     st.error("❌ AI Models")
-                st.caption(self.translator.t('sidebar_ai_models'))
+                st.caption(t('sidebar_ai_models'))
             
             with status_col2:
                 st.success("✅ Security")
-                st.caption(self.translator.t('sidebar_security'))
+                st.caption(t('sidebar_security'))
     
     def _get_example_tickets(self) -> List[Dict[str, str]]:
         """Get comprehensive example tickets with translations."""
-        examples = [
-            {
-                "title_key": "example_emergency",
-                "desc_key": "example_emergency_desc",
-                "text_en": "URGENT: Fire alarm system malfunction at Ministry of AI building, Dubai Internet City. Multiple floors affected. People reporting smoke smell. Emirates ID: 784-1990-1234567-1. Contact: +971501234567. Need immediate emergency response team deployment.",
-                "text_ar": "عاجل: عطل في نظام إنذار الحريق في مبنى وزارة الذكاء الاصطناعي، دبي إنترنت سيتي. طوابق متعددة متأثرة. أشخاص يبلغون عن رائحة دخان. رقم الهوية: 784-1990-1234567-1. الاتصال: +971501234567. يحتاج إلى نشر فريق الاستجابة للطوارئ فوراً."
-            },
-            {
-                "title_key": "example_technical",
-                "desc_key": "example_technical_desc",
-                "text_en": "DEWA online payment portal not working since 9:00 AM. Users receiving 'Error 500: Internal Server Error' when trying to pay bills. Issue affecting all customers in Dubai area. Need urgent technical team intervention to restore service.",
-                "text_ar": "بوابة الدفع الإلكتروني لهيئة كهرباء ومياه دبي لا تعمل منذ الساعة 9:00 صباحاً. المستخدمون يتلقون 'خطأ 500: خطأ في الخادم الداخلي' عند محاولة دفع الفواتير. المشكلة تؤثر على جميع العملاء في منطقة دبي. يحتاج إلى تدخل فوري من الفريق التقني لاستعادة الخدمة."
-            },
-            {
-                "title_key": "example_billing",
-                "desc_key": "example_billing_desc",
-                "text_en": "Incorrect charges on Etisalat invoice for November 2024. Bill shows 750 AED for international calls to USA, but no international calls were made from my number +971501234567. Need detailed call logs and immediate correction of charges.",
-                "text_ar": "رسوم غير صحيحة على فاتورة اتصالات لشهر نوفمبر 2024. الفاتورة تظهر 750 درهماً لمكالمات دولية إلى الولايات المتحدة، ولكن لم تجر أي مكالمات دولية من رقمي +971501234567. يحتاج إلى سجلات مكالمات مفصلة وتصحيح فوري للرسوم."
-            },
-            {
-                "title_key": "example_facilities",
-                "desc_key": "example_facilities_desc",
-                "text_en": "Air conditioning system malfunction in Dubai Government Customer Happiness Center, Al Barsha. Temperature reading 30°C inside building, causing discomfort for visitors and staff. Urgent maintenance required. Building ID: DXB-GOV-0456.",
-                "text_ar": "عطل في نظام التكييف في مركز سعادة المتعاملين الحكومي بدبي، البرشاء. قراءة درجة الحرارة 30° مئوية داخل المبنى، مما يسبب عدم راحة للزوار والموظفين. يحتاج إلى صيانة عاجلة. رقم المبنى: DXB-GOV-0456."
-            },
-            {
-                "title_key": "example_inquiry",
-                "desc_key": "example_inquiry_desc",
-                "text_en": "Need to inquire about Emirates ID renewal process for family of 4. What documents are required? What is the processing time? My Emirates ID: 784-1995-5678901-5. Please provide step-by-step guidance and appointment scheduling options.",
-                "text_ar": "أحتاج إلى الاستفسار عن عملية تجديد هوية الإمارات لعائلة مكونة من 4 أفراد. ما هي المستندات المطلوبة؟ ما هو وقت المعالجة؟ رقم هوية الإمارات الخاصة بي: 784-1995-5678901-5. يرجى تقديم إرشادات خطوة بخطوة وخيارات جدولة المواعيد."
-            }
-        ]
-        
-        # Translate all example data
-        for example in examples:
-            example["title"] = self.translator.t(example["title_key"])
-            example["description"] = self.translator.t(example["desc_key"])
-            example["text"] = example["text_ar"] if st.session_state.language == "ar" else example["text_en"]
-        
-        return examples
+        return build_examples(st.session_state.language)
     
-    def _display_ticket_input_section(self):
-        """Display ticket input section with examples - Fixed layout."""
+    def _display_example_picker(self):
+        """Example buttons and preview of the selected example."""
+        t = self.translator.t
         # Example Tickets Section
-        st.markdown(f"### 📋 {self.translator.t('section_examples')}")
-        st.markdown(self.translator.t('example_select'))
+        st.markdown(f"### 📋 {t('section_examples')}")
+        st.markdown(t('example_select'))
         
         examples = self._get_example_tickets()
         
-        # Display 3 example buttons per row - No nested columns
-        for i in range(0, len(examples), 3):
-            row_examples = examples[i:i+3]
-            cols = st.columns(len(row_examples))
-            
-            for idx, (col, example) in enumerate(zip(cols, row_examples)):
-                with col:
-                    # Display example button with proper styling
-                    if st.button(
-                        example["title"],
-                        key=f"example_{i+idx}",
-                        help=example["description"],
-                        use_container_width=True
-                    ):
-                        st.session_state.ticket_text = example["text"]
-                        st.session_state.selected_example = example["title_key"]
-                        st.rerun()
+        # All example buttons in a single row - No nested columns
+        cols = st.columns(len(examples), gap="small")
+        for idx, (col, example) in enumerate(zip(cols, examples)):
+            with col:
+                # Display example button with proper styling
+                if st.button(
+                    example["title"],
+                    key=f"example_{idx}",
+                    help=example["description"],
+                    use_container_width=True
+                ):
+                    st.session_state.ticket_text = example["text"]
+                    st.session_state.selected_example = example["title_key"]
+                    st.rerun()
         
         # Show selected example preview
         if st.session_state.selected_example:
@@ -753,19 +749,23 @@ class UAEGovTicketSystem:
                     st.info(selected["text"])
                     if st.button("🚀 Analyze This Example", type="primary", use_container_width=True):
                         self._process_ticket(selected["text"])
+    
+    def _display_ticket_input_section(self):
+        """Display ticket input section with examples - Fixed layout."""
+        t = self.translator.t
+        self._display_example_picker()
         
         st.divider()
         
         # Ticket Input Section
-        st.markdown(f"### 📝 {self.translator.t('section_input')}")
+        st.markdown(f"### 📝 {t('section_input')}")
         
-        # Text area with language direction
-        text_dir = "rtl" if st.session_state.language == "ar" else "ltr"
+        # Text area
         ticket_text = st.text_area(
-            self.translator.t('input_label'),
+            t('input_label'),
             value=st.session_state.ticket_text,
             height=200,
-            placeholder=self.translator.t('input_placeholder'),
+            placeholder=t('input_placeholder'),
             key="ticket_input_area",
             help="Enter complete ticket details. AI will automatically protect sensitive information."
         )
@@ -777,16 +777,15 @@ class UAEGovTicketSystem:
         
         with btn_col1:
             if ticket_text.strip():
-                chars = len(ticket_text)
-                words = len(ticket_text.split())
-                st.caption(self.translator.t('input_stats').format(chars, words))
+                chars, words = text_stats(ticket_text)
+                st.caption(t('input_stats').format(chars, words))
             else:
                 st.caption("Enter ticket text to begin analysis")
         
         with btn_col2:
-            analyze_disabled = not ticket_text.strip() or not MODELS_LOADED or st.session_state.processing_in_progress
+            analyze_disabled = not ticket_text.strip() or self.processor is None or st.session_state.processing_in_progress
             if st.button(
-                self.translator.t('btn_analyze'),
+                t('btn_analyze'),
                 disabled=analyze_disabled,
                 use_container_width=True,
                 type="primary" if not analyze_disabled else "secondary"
@@ -794,7 +793,7 @@ class UAEGovTicketSystem:
                 self._process_ticket(ticket_text)
         
         with btn_col3:
-            if st.button(self.translator.t('btn_clear'), use_container_width=True, type="secondary"):
+            if st.button(t('btn_clear'), use_container_width=True, type="secondary"):
                 st.session_state.ticket_text = ""
                 st.session_state.selected_example = None
                 st.rerun()
@@ -802,68 +801,47 @@ class UAEGovTicketSystem:
     def _get_ai_action(self, result: Dict) -> str:
         """Get AI suggested action from results - FIXED implementation."""
         decisions = result['final_decisions']
-        
-        # Map actions based on priority and category
-        if decisions['priority'] == 'Critical':
-            return self.translator.t('action_emergency')
-        elif decisions['category'] == 'Technical / IT':
-            return self.translator.t('action_technical')
-        elif decisions['category'] == 'Billing':
-            return self.translator.t('action_billing')
-        elif decisions['category'] == 'Facilities':
-            return self.translator.t('action_facilities')
-        elif decisions['category'] == 'Inquiry':
-            return self.translator.t('action_inquiry')
-        elif decisions['sentiment'] == 'Negative':
-            return self.translator.t('action_inquiry')  # Contact for negative sentiment
-        else:
-            return self.translator.t('action_standard')
+        return self.translator.t(action_key(decisions['priority'], decisions['category'], decisions['sentiment']))
     
     def _process_ticket(self, text: str):
         """Process a ticket with proper error handling and performance tracking."""
+        t = self.translator.t
         if not text.strip():
-            st.error(self.translator.t('status_error_empty'))
+            st.error(t('status_error_empty'))
             return
         
         if not self.processor:
-            st.error(self.translator.t('status_error_models'))
+            st.error(t('status_error_models'))
             return
         
         # Set processing flag
         st.session_state.processing_in_progress = True
         
         try:
-            # Show processing animation
-            with st.spinner(f"⏳ {self.translator.t('status_processing')}"):
-                # Simulate processing steps for better UX
-                progress_text = st.empty()
-                progress_bar = st.progress(0)
-                
-                steps = ["Analyzing text...", "Checking for sensitive data...", 
-                        "Running AI models...", "Applying business rules..."]
-                
-                for i, step in enumerate(steps):
-                    progress_text.text(f"⏳ {step}")
-                    progress_bar.progress((i + 1) / len(steps))
-                    time.sleep(0.3)
+            # Report real progress while the ticket is processed
+            with st.status(f"⏳ {t('status_processing')}") as status:
+                status.update(label="⏳ Running AI models...")
                 
                 # Actual processing
-                start_time = time.time()
-                result = self.processor.process_text(text.strip())
-                processing_time = time.time() - start_time
+                start_time = time.perf_counter()
+                result = self.processor.process_text(
+                    text.strip(), confidence_threshold=st.session_state.confidence_threshold
+                )
+                processing_time = time.perf_counter() - start_time
+                
+                status.update(label="⏳ Applying business rules...")
                 
                 # Store processing time
                 st.session_state.processing_times.append(processing_time)
-                if len(st.session_state.processing_times) > 50:
-                    st.session_state.processing_times = st.session_state.processing_times[-50:]
                 
                 # Get AI action
                 ai_action = self._get_ai_action(result)
                 
                 # Create comprehensive history entry
+                now = datetime.now()
                 history_entry = {
-                    'timestamp': datetime.now().strftime("%H:%M:%S"),
-                    'date': datetime.now().strftime("%Y-%m-%d"),
+                    'timestamp': now.strftime("%H:%M:%S"),
+                    'date': now.strftime("%Y-%m-%d"),
                     'ticket_id': result['final_decisions']['ticket_id'],
                     'category': result['final_decisions']['category'],
                     'sentiment': result['final_decisions']['sentiment'],
@@ -878,20 +856,18 @@ class UAEGovTicketSystem:
                 }
                 
                 # Add to history
-                st.session_state.ticket_history.append(history_entry)
-                if len(st.session_state.ticket_history) > 100:
-                    st.session_state.ticket_history = st.session_state.ticket_history[-100:]
+                st.session_state.ticket_history.append(history_entry)  # deque evicts the oldest
+                for name, column in st.session_state.history_columns.items():
+                    column.append(history_entry[name])
                 
                 # Store current result
                 st.session_state.current_result = result
                 
-                # Clear processing indicators
-                progress_text.empty()
-                progress_bar.empty()
-                
-                # Show success message
-                st.success(f"✅ {self.translator.t('status_complete')}")
-                st.toast(f"{self.translator.t('status_success')}: {history_entry['ticket_id']}")
+                status.update(label=f"✅ {t('status_complete')}", state="complete")
+            
+            # Show success message
+            st.success(f"✅ {t('status_complete')}")
+            st.toast(f"{t('status_success')}: {history_entry['ticket_id']}")
                 
         except Exception as e:
             st.error(f"❌ Processing error: {str(e)}")
@@ -903,6 +879,7 @@ class UAEGovTicketSystem:
     
     def _display_ticket_results(self):
         """Display analysis results - Fixed with comprehensive data."""
+        labels = labels_for(st.session_state.language)
         if not st.session_state.current_result:
             return
         
@@ -912,252 +889,169 @@ class UAEGovTicketSystem:
         pii_info = result['pii_protection']
         safety_info = result['safety_check']
         
-        st.markdown(f"### 📊 {self.translator.t('results_title')}")
+        st.markdown(f"### 📊 {labels.results_title}")
         
         # Results metrics in 4 columns - No nesting
         res_col1, res_col2, res_col3, res_col4 = st.columns(4)
         
-        with res_col1:
-            st.markdown('<div class="gov-card">', unsafe_allow_html=True)
-            st.markdown(f"**{self.translator.t('results_ticket_id')}**")
+        with res_col1, st.container(border=True):
+            st.markdown(f"**{labels.results_ticket_id}**")
             st.code(decisions['ticket_id'], language="text")
-            st.markdown(f"**Processed:** {result['ticket_processing']['timestamp'].split('T')[0]}")
+            processed = f"**Processed:** {result['ticket_processing']['timestamp'].split('T')[0]}"
             if 'processing_time' in result:
-                st.markdown(f"**Duration:** {result['processing_time']:.2f}s")
-            st.markdown('</div>', unsafe_allow_html=True)
+                processed += f"  \n**Duration:** {result['processing_time']:.2f}s"
+            st.markdown(processed)
         
-        with res_col2:
-            st.markdown('<div class="gov-card">', unsafe_allow_html=True)
-            st.markdown(f"**{self.translator.t('results_priority')}**")
-            
+        with res_col2, st.container(border=True):
             priority = decisions['priority']
-            priority_class = f"priority-{priority.lower()}"
-            st.markdown(f'<div class="{priority_class}">{priority}</div>', unsafe_allow_html=True)
-            
-            st.markdown(f"**{self.translator.t('results_response_time')}:** {decisions['response_time']}")
-            st.markdown(f"**{self.translator.t('results_department')}:** {decisions['department']}")
-            
+            # Badge and routing details in one markdown pass
+            priority_html = (
+                f"<p><strong>{labels.results_priority}</strong></p>"
+                f'<div class="priority-badge priority-{priority.lower()}">{priority}</div>'
+                f"<p><strong>{labels.results_response_time}:</strong> {decisions['response_time']}<br>"
+                f"<strong>{labels.results_department}:</strong> {decisions['department']}</p>"
+            )
             # Safety override indicator
             if safety_info['needs_override'] and not safety_info['is_spam']:
-                st.markdown('<div class="status-warning status-indicator">🚨 Safety Override</div>', unsafe_allow_html=True)
-            
-            st.markdown('</div>', unsafe_allow_html=True)
+                priority_html += '<div class="status-warning status-indicator">🚨 Safety Override</div>'
+            st.markdown(priority_html, unsafe_allow_html=True)
         
-        with res_col3:
-            st.markdown('<div class="gov-card">', unsafe_allow_html=True)
-            st.markdown(f"**{self.translator.t('results_confidence')}**")
-            
+        with res_col3, st.container(border=True):
             conf = decisions['confidence_score']
             if conf >= 0.8:
                 conf_class = "confidence-high"
-                conf_label = self.translator.t('results_confidence_high')
+                conf_label = labels.results_confidence_high
                 icon = "🟢"
             elif conf >= 0.55:
                 conf_class = "confidence-medium"
-                conf_label = self.translator.t('results_confidence_medium')
+                conf_label = labels.results_confidence_medium
                 icon = "🟡"
             else:
                 conf_class = "confidence-low"
-                conf_label = self.translator.t('results_confidence_low')
+                conf_label = labels.results_confidence_low
                 icon = "🔴"
             
-            st.markdown(f'<div class="{conf_class}">{icon} {conf:.1%}</div>', unsafe_allow_html=True)
-            st.markdown(f'<div>{conf_label}</div>', unsafe_allow_html=True)
-            
-            if decisions['needs_manual_review']:
-                st.markdown('<div class="status-error status-indicator">⚠️ {}</div>'.format(
-                    self.translator.t('results_manual_review')), unsafe_allow_html=True)
-                if decisions['manual_review_reason']:
-                    st.caption(f"Reason: {decisions['manual_review_reason']}")
-            else:
-                st.markdown('<div class="status-success status-indicator">✅ {}</div>'.format(
-                    self.translator.t('results_auto_processing')), unsafe_allow_html=True)
+            review_html = _review_status_html(st.session_state.language)[bool(decisions['needs_manual_review'])]
             
-            st.markdown('</div>', unsafe_allow_html=True)
+            st.markdown(
+                f"<p><strong>{labels.results_confidence}</strong></p>"
+                f'<div class="{conf_class}">{icon} {conf:.1%}</div>'
+                f"<div>{conf_label}</div>{review_html}",
+                unsafe_allow_html=True
+            )
+            if decisions['needs_manual_review'] and decisions['manual_review_reason']:
+                st.caption(f"Reason: {decisions['manual_review_reason']}")
         
-        with res_col4:
-            st.markdown('<div class="gov-card">', unsafe_allow_html=True)
-            st.markdown(f"**{self.translator.t('results_sentiment')}**")
-            
-            sentiment = decisions['sentiment']
-            sentiment_map = {
-                'Positive': ('😊', self.translator.t('results_positive_feedback'), '#10B981'),
-                'Neutral': ('😐', 'Neutral', '#6B7280'),
-                'Negative': ('😠', self.translator.t('results_dissatisfaction'), '#DC2626')
-            }
-            icon, sentiment_text, color = sentiment_map.get(sentiment, ('😐', 'Neutral', '#6B7280'))
-            
-            st.markdown(f'<div style="font-size: 1.8rem; color: {color}; font-weight: 700; margin: 10px 0;">{icon} {sentiment_text}</div>', 
-                       unsafe_allow_html=True)
-            
-            st.markdown(f"**{self.translator.t('results_category')}:** {decisions['category']}")
+        with res_col4, st.container(border=True):
+            icon, sentiment_text, color = _sentiment_display(st.session_state.language).get(
+                decisions['sentiment'], _NEUTRAL_SENTIMENT)
+            
+            # Native colored text instead of an inline-styled HTML block, whole card in one element
+            st.markdown(
+                f"**{labels.results_sentiment}**\n\n"
+                f"#### :{color}[{icon} {sentiment_text}]\n\n"
+                f"**{labels.results_category}:** {decisions['category']}"
+            )
             if 'category_confidence' in ml_results:
                 st.caption(f"Confidence: {ml_results['category_confidence']:.1%}")
-            
-            st.markdown('</div>', unsafe_allow_html=True)
         
         # Department and Actions in 2 columns
-        st.markdown(f"### 🏢 {self.translator.t('dept_assignment')}")
+        st.markdown(f"### 🏢 {labels.dept_assignment}")
         
         dept_col1, dept_col2 = st.columns(2)
         
-        with dept_col1:
-            st.markdown('<div class="gov-card">', unsafe_allow_html=True)
-            st.markdown(f"**{decisions['department']}**")
-            st.markdown(f"**{self.translator.t('dept_supervisor')}:** {decisions['department_contact']['supervisor']}")
-            st.markdown(f"**{self.translator.t('dept_phone')}:** {decisions['department_contact']['phone']}")
-            st.markdown(f"**{self.translator.t('dept_email')}:** {decisions['department_contact']['email']}")
+        with dept_col1, st.container(border=True):
+            contact = decisions['department_contact']
+            st.markdown(
+                f"**{decisions['department']}**  \n"
+                f"**{labels.dept_supervisor}:** {contact['supervisor']}  \n"
+                f"**{labels.dept_phone}:** {contact['phone']}  \n"
+                f"**{labels.dept_email}:** {contact['email']}"
+            )
             
             # PII protection status
             if pii_info['has_pii']:
-                st.markdown('<div class="status-success status-indicator">✅ PII Protected</div>', unsafe_allow_html=True)
+                st.success("✅ PII Protected")
             else:
-                st.markdown('<div class="status-info status-indicator">ℹ️ No PII Detected</div>', unsafe_allow_html=True)
-            
-            st.markdown('</div>', unsafe_allow_html=True)
+                st.info("ℹ️ No PII Detected")
         
-        with dept_col2:
-            st.markdown('<div class="gov-card">', unsafe_allow_html=True)
-            st.markdown(f"**{self.translator.t('actions_title')}**")
-            
-            if decisions['action_items']:
-                for i, action in enumerate(decisions['action_items'], 1):
-                    st.markdown(f'<div class="action-item"><span style="font-weight: 700;">{i}.</span> {action}</div>', 
-                              unsafe_allow_html=True)
-            else:
-                st.info("No specific actions required")
-            
-            # Response timeline
+        with dept_col2, st.container(border=True):
+            # Title, action items and response timeline in one markdown element
+            card_html = [f"<p><strong>{labels.actions_title}</strong></p>"]
+            card_html.extend(
+                f'<div class="action-item"><span style="font-weight: 700;">{i}.</span> {action}</div>'
+                for i, action in enumerate(decisions['action_items'], 1)
+            )
             if decisions.get('response_time'):
-                st.markdown(f"**⏱️ {self.translator.t('results_response_time')}:** {decisions['response_time']}")
+                card_html.append(f"<p><strong>⏱️ {labels.results_response_time}:</strong> {decisions['response_time']}</p>")
+            st.markdown("".join(card_html), unsafe_allow_html=True)
             
-            st.markdown('</div>', unsafe_allow_html=True)
+            if not decisions['action_items']:
+                st.info("No specific actions required")
     
     def _display_ticket_history_table(self):
         """Display ticket history table using st.dataframe() - Fixed implementation."""
-        st.markdown(f"### 📚 {self.translator.t('history_title')}")
+        labels = labels_for(st.session_state.language)
+        st.markdown(f"### 📚 {labels.history_title}")
         
         if not st.session_state.ticket_history:
-            st.info(self.translator.t('history_no_data'))
+            st.info(labels.history_no_data)
             return
         
-        # Prepare data for dataframe
-        history_data = []
-        for ticket in st.session_state.ticket_history[-20:]:  # Last 20 tickets
-            # Get status indicator
-            if ticket.get('needs_review', False):
-                status = "⚠️ Manual"
-                status_color = "#DC2626"
-            else:
-                status = "✅ Auto"
-                status_color = "#10B981"
-            
-            # Get priority badge
-            priority = ticket['priority']
-            priority_map = {
-                'Critical': '🔴',
-                'High': '🟠', 
-                'Medium': '🟢',
-                'Low': '🔵'
-            }
-            priority_icon = priority_map.get(priority, '🟢')
-            
-            history_data.append({
-                self.translator.t('history_time'): ticket['timestamp'],
-                self.translator.t('history_ticket_id'): ticket['ticket_id'],
-                self.translator.t('history_category'): ticket['category'],
-                self.translator.t('history_priority'): f"{priority_icon} {priority}",
-                self.translator.t('history_status'): status,
-                self.translator.t('history_ai_action'): ticket['ai_action']
+        # Rebuild the frame only when a ticket was added or the language changed
+        history = st.session_state.ticket_history
+        cache_key = (len(history), st.session_state.language, id(history[-1]))
+        if st.session_state.get('_history_df_key') != cache_key:
+            # Deferred so sessions that never reach the history table skip the pandas import
+            import pandas as pd
+            
+            # One comprehension per column over the last 20 tickets
+            recent_tickets = tail(history, 20)
+            st.session_state._history_df = pd.DataFrame({
+                labels.history_time: [ticket['timestamp'] for ticket in recent_tickets],
+                labels.history_ticket_id: [ticket['ticket_id'] for ticket in recent_tickets],
+                labels.history_category: [ticket['category'] for ticket in recent_tickets],
+                labels.history_priority: [f"{PRIORITY_ICONS.get(ticket['priority'], '🟢')} {ticket['priority']}" for ticket in recent_tickets],
+                labels.history_status: [REVIEW_STATUS[bool(ticket.get('needs_review', False))] for ticket in recent_tickets],
+                labels.history_ai_action: [ticket['ai_action'] for ticket in recent_tickets]
             })
-        
-        # Create and display dataframe
-        df = pd.DataFrame(history_data)
+            st.session_state._history_df_key = cache_key
         
         # Display with professional styling
         st.dataframe(
-            df,
+            st.session_state._history_df,
             use_container_width=True,
             hide_index=True,
-            column_config={
-                self.translator.t('history_time'): st.column_config.TextColumn(
-                    self.translator.t('history_time'),
-                    width="small"
-                ),
-                self.translator.t('history_ticket_id'): st.column_config.TextColumn(
-                    self.translator.t('history_ticket_id'),
-                    width="medium"
-                ),
-                self.translator.t('history_category'): st.column_config.TextColumn(
-                    self.translator.t('history_category'),
-                    width="medium"
-                ),
-                self.translator.t('history_priority'): st.column_config.TextColumn(
-                    self.translator.t('history_priority'),
-                    width="small"
-                ),
-                self.translator.t('history_status'): st.column_config.TextColumn(
-                    self.translator.t('history_status'),
-                    width="small"
-                ),
-                self.translator.t('history_ai_action'): st.column_config.TextColumn(
-                    self.translator.t('history_ai_action'),
-                    width="large"
-                )
-            }
+            column_config=history_column_config(st.session_state.language)
         )
         
-        # History summary
-        if st.session_state.ticket_history:
-            st.markdown(f"#### 📊 {self.translator.t('history_summary')}")
-            
-            summary_col1, summary_col2, summary_col3, summary_col4 = st.columns(4)
-            
-            recent = st.session_state.ticket_history[-15:]
-            
-            with summary_col1:
-                total = len(recent)
-                st.metric(self.translator.t('history_total'), total)
-            
-            with summary_col2:
-                avg_conf = np.mean([t['confidence'] for t in recent]) if recent else 0
-                st.metric(self.translator.t('history_avg_conf'), f"{avg_conf:.1%}")
-            
-            with summary_col3:
-                critical = sum(1 for t in recent if t['priority'] == 'Critical')
-                st.metric(self.translator.t('history_critical'), critical)
-            
-            with summary_col4:
-                manual = sum(1 for t in recent if t.get('needs_review', False))
-                st.metric(self.translator.t('history_manual'), manual)
+        # History summary (the empty case returned above)
+        st.markdown(f"#### 📊 {labels.history_summary}")
+        
+        summary_col1, summary_col2, summary_col3, summary_col4 = st.columns(4)
+        
+        total, avg_conf, critical, manual = summarize_history(st.session_state.history_columns, 15)
+        
+        with summary_col1:
+            st.metric(labels.history_total, total)
+        
+        with summary_col2:
+            st.metric(labels.history_avg_conf, f"{avg_conf:.1%}")
+        
+        with summary_col3:
+            st.metric(labels.history_critical, critical)
+        
+        with summary_col4:
+            st.metric(labels.history_manual, manual)
     
     def _display_footer(self):
         """Display professional government footer."""
-        direction_class = "text-direction-rtl" if st.session_state.language == "ar" else "text-direction-ltr"
-        
-        st.markdown(f"""
-        <div class="gov-footer {direction_class}">
-            <div style="text-align: center;">
-                <div style="display: flex; justify-content: center; gap: 1rem; margin-bottom: 1rem; font-size: 1.5rem;">
-                    <span>🏛️</span>
-                    <span>🤖</span>
-                    <span>🇦🇪</span>
-                </div>
-                <p style="color: var(--uae-green-dark); font-weight: 700; margin-bottom: 0.5rem;">
-                    {self.translator.t('footer_title')}
-                </p>
-                <p style="color: var(--uae-gray); font-size: 0.9rem; margin-bottom: 0.5rem;">
-                    {self.translator.t('footer_subtitle')} • Python 3.12.7 • Streamlit 1.31.0
-                </p>
-                <p style="color: var(--uae-gray); font-size: 0.8rem;">
-                    {self.translator.t('footer_copyright')} • All Rights Reserved
-                </p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_render_footer_html(st.session_state.language), unsafe_allow_html=True)
     
     def run(self):
         """Main application runner - Professional implementation."""
+        self._init_session_state()
+        
         # Apply styles
         self._apply_styles()
         
@@ -1194,6 +1088,11 @@ class UAEGovTicketSystem:
         st.divider()
         self._display_footer()
 
+@st.cache_resource(show_spinner=False)
+def get_app() -> UAEGovTicketSystem:
+    """App object shared by every rerun and session; it holds no per-user state."""
+    return UAEGovTicketSystem()
+
 # ============================================
 # MAIN APPLICATION ENTRY POINT
 # ============================================
@@ -1213,7 +1112,7 @@ def main():
         )
         
         # Initialize and run application
-        app = UAEGovTicketSystem()
+        app = get_app()
         app.run()
         
     except KeyboardInterrupt:
@@ -7,12 +7,19 @@ Created for UAE Government Enterprise Deployment
 
 import pandas as pd
 import numpy as np
-import random
-from datetime import datetime, timedelta
-import re
-from typing import List, Dict, Tuple
+from string import Formatter
+from typing import List, Optional
 import logging
 
+# Optional: Arrow-backed string storage
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Free-text columns use Arrow-backed strings when pyarrow is present
+STRING_DTYPE = "string[pyarrow]" if pa is not None else "string"
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,210 +32,276 @@ class TicketDataGenerator:
     """
     
     # UAE Government Entities
-    UAE_ENTITIES = [
+    UAE_ENTITIES = (
         "DEWA", "RTA", "Etisalat", "ICA", "Tasheel", "Dubai Police",
         "Abu Dhabi Government", "Dubai Municipality", "Sharjah Municipality",
         "DHA", "ADNOC", "Dubai Courts", "GDRFA", "Mohre",
         "Dubai Land Department", "Civil Defense", "DED", "Du", "Amer"
-    ]
+    )
     
     # Service Categories
-    CATEGORIES = [
+    CATEGORIES = (
         "Facilities",
         "Technical / IT", 
         "Billing",
         "Inquiry",
         "Safety / Emergency"
-    ]
+    )
     
     # Sentiment Levels
-    SENTIMENTS = ["Positive", "Neutral", "Negative"]
+    SENTIMENTS = ("Positive", "Neutral", "Negative")
+    
+    # Sentiment mix: 20% Positive, 30% Neutral, 50% Negative
+    SENTIMENT_WEIGHTS = (0.2, 0.3, 0.5)
     
     # Priority Levels
-    PRIORITIES = ["Low", "Medium", "High", "Critical"]
+    PRIORITIES = ("Low", "Medium", "High", "Critical")
+    
+    # Candidate priorities per (category, sentiment); multi-entry buckets are drawn uniformly
+    PRIORITY_RULES = {
+        ("Safety / Emergency", "Negative"): ("Critical",),
+        ("Safety / Emergency", "Neutral"): ("High",),
+        ("Safety / Emergency", "Positive"): ("High",),
+        ("Technical / IT", "Negative"): ("High", "Medium"),
+        ("Technical / IT", "Neutral"): ("Medium",),
+        ("Technical / IT", "Positive"): ("Medium",),
+        ("Billing", "Negative"): ("Medium",),
+        ("Billing", "Neutral"): ("Medium",),
+        ("Billing", "Positive"): ("Medium",),
+        ("Facilities", "Negative"): ("High",),
+        ("Facilities", "Neutral"): ("Medium", "Low"),
+        ("Facilities", "Positive"): ("Medium", "Low"),
+        ("Inquiry", "Negative"): ("Low",),
+        ("Inquiry", "Neutral"): ("Low",),
+        ("Inquiry", "Positive"): ("Low",)
+    }
+    
+    # Entities that handle each category
+    CATEGORY_ENTITIES = {
+        "Inquiry": UAE_ENTITIES,
+        "Safety / Emergency": ("Civil Defense", "DHA", "RTA", "Municipality"),
+        "Technical / IT": ("Etisalat", "RTA", "Tasheel", "DEWA", "Du"),
+        "Billing": ("DEWA", "Etisalat", "Du", "RTA"),
+        "Facilities": ("Dubai Municipality", "RTA", "DEWA", "Sharjah Municipality")
+    }
+    
+    # Every entity a ticket can name (category pools include "Municipality")
+    ENTITY_NAMES = tuple(dict.fromkeys(
+        entity for pool in CATEGORY_ENTITIES.values() for entity in pool
+    ))
     
     # UAE-specific keywords
     UAE_KEYWORDS = {
-        "DEWA": ["electricity", "water", "bill", "charges", "outage", "green charger"],
-        "RTA": ["nol card", "metro", "salik", "driving license", "bus", "traffic"],
-        "Etisalat": ["internet", "mobile", "bill", "data", "connection"],
-        "ICA": ["emirates id", "passport", "visa", "immigration"],
-        "Tasheel": ["visa renewal", "labor contract", "document", "appointment"],
-        "Safety / Emergency": ["fire", "gas leak", "accident", "urgent", "emergency", "trapped"]
+        "DEWA": ("electricity", "water", "bill", "charges", "outage", "green charger"),
+        "RTA": ("nol card", "metro", "salik", "driving license", "bus", "traffic"),
+        "Etisalat": ("internet", "mobile", "bill", "data", "connection"),
+        "ICA": ("emirates id", "passport", "visa", "immigration"),
+        "Tasheel": ("visa renewal", "labor contract", "document", "appointment"),
+        "Safety / Emergency": ("fire", "gas leak", "accident", "urgent", "emergency", "trapped")
     }
     
     # Sentence templates for each category and sentiment
     TICKET_TEMPLATES = {
         "Facilities": {
-            "Positive": [
+            "Positive": (
                 "New {facility} installed in {area} - excellent work",
                 "{entity} maintenance team was very professional",
                 "Public {facility} renovation completed ahead of schedule",
                 "{area} community center improvements are appreciated"
-            ],
-            "Neutral": [
+            ),
+            "Neutral": (
                 "Request for {facility} maintenance in {area}",
                 "{facility} inspection needed at {location}",
                 "Schedule {facility} repair for {area}"
-            ],
-            "Negative": [
+            ),
+            "Negative": (
                 "{facility} not working at {location} for {duration}",
                 "Poor condition of {facility} in {area}",
                 "Urgent repair needed for {facility} at {location}"
-            ]
+            )
         },
         "Technical / IT": {
-            "Positive": [
+            "Positive": (
                 "{entity} online portal working smoothly now",
                 "Technical issue resolved quickly by {entity} team",
                 "System upgrade completed successfully"
-            ],
-            "Neutral": [
+            ),
+            "Neutral": (
                 "{entity} system access issue",
                 "Need assistance with {entity} online services",
                 "Technical query regarding {system}"
-            ],
-            "Negative": [
+            ),
+            "Negative": (
                 "{entity} website down since {time}",
                 "Cannot login to {entity} portal - error message",
                 "{system} crashed during {operation}"
-            ]
+            )
         },
         "Billing": {
-            "Positive": [
+            "Positive": (
                 "Bill payment process was seamless",
                 "Thank you for resolving billing discrepancy",
                 "Payment refund processed quickly"
-            ],
-            "Neutral": [
+            ),
+            "Neutral": (
                 "Query about {entity} charges for {period}",
                 "Need clarification on billing statement",
                 "Invoice details request"
-            ],
-            "Negative": [
+            ),
+            "Negative": (
                 "Incorrect charges on {entity} bill",
                 "Overcharged for {service} by {entity}",
                 "Payment made but still showing as pending"
-            ]
+            )
         },
         "Inquiry": {
-            "Positive": [
+            "Positive": (
                 "Excellent service at {entity} center",
                 "Thank you for prompt response to my query",
                 "Information provided was very helpful"
-            ],
-            "Neutral": [
+            ),
+            "Neutral": (
                 "Need information about {entity} {service}",
                 "Query regarding {process} requirements",
                 "Status check for {application}"
-            ],
-            "Negative": [
+            ),
+            "Negative": (
                 "No response to my inquiry about {topic}",
                 "Conflicting information received from {entity}",
                 "Cannot get clear answer about {issue}"
-            ]
+            )
         },
         "Safety / Emergency": {
-            "Positive": [
+            "Positive": (
                 "Emergency response was very quick - thank you",
                 "Safety inspection completed thoroughly",
                 "Hazard reported and resolved promptly"
-            ],
-            "Neutral": [
+            ),
+            "Neutral": (
                 "Report of potential safety issue at {location}",
                 "Request for safety inspection at {area}",
                 "Need guidance on safety protocols for {situation}"
-            ],
-            "Negative": [
+            ),
+            "Negative": (
                 "URGENT: {hazard} at {location} - immediate action needed",
                 "Safety hazard reported but no response",
                 "Emergency situation at {location} - help required"
-            ]
+            )
         }
     }
     
     # UAE locations
-    UAE_LOCATIONS = [
+    UAE_LOCATIONS = (
         "Dubai Marina", "Al Barsha", "Sheikh Zayed Road", "Abu Dhabi City",
         "Sharjah Industrial Area", "Deira", "Bur Dubai", "Jumeirah",
         "Al Ain", "Ras Al Khaimah", "Fujairah", "Ajman", "Umm Al Quwain",
         "Business Bay", "Downtown Dubai", "Silicon Oasis", "Motor City"
-    ]
+    )
     
     # Facilities/Systems
-    FACILITIES = [
+    FACILITIES = (
         "AC system", "elevator", "parking machine", "street lights",
         "water fountain", "public restroom", "playground equipment",
         "lighting system", "security cameras", "fire alarm"
-    ]
+    )
+    
+    # UAE mobile prefixes
+    MOBILE_PREFIXES = ("50", "52", "54", "55", "56", "58")
+    
+    # Values for each template placeholder ({entity} is supplied per ticket)
+    SLOT_VALUES = {
+        "facility": FACILITIES,
+        "area": UAE_LOCATIONS,
+        "location": UAE_LOCATIONS,
+        "duration": tuple(f"{hours} hours" for hours in range(1, 25)),
+        "time": tuple(f"{hour}:{minute}" for hour in range(1, 13) for minute in ("00", "30")),
+        "system": ("portal", "app", "website", "payment system"),
+        "operation": ("renewal", "payment", "registration", "booking"),
+        "period": ("November", "December", "last month", "Q4 2024"),
+        "service": ("internet", "electricity", "water", "mobile"),
+        "process": ("renewal", "application", "registration", "payment"),
+        "application": ("Emirates ID", "visa", "license", "permit"),
+        "topic": ("charges", "requirements", "status", "documents"),
+        "issue": ("fees", "timeline", "requirements", "process"),
+        "hazard": ("gas leak", "fire", "electrical hazard", "structural damage"),
+        "situation": ("construction", "public event", "school zone", "parking")
+    }
+    
+    # (template, placeholder names) per (category, sentiment), parsed once at import
+    COMPILED_TEMPLATES = {
+        (category, sentiment): tuple(
+            (template, tuple(field for _, field, _, _ in Formatter().parse(template) if field))
+            for template in templates
+        )
+        for category, by_sentiment in TICKET_TEMPLATES.items()
+        for sentiment, templates in by_sentiment.items()
+    }
+    
+    # Most placeholders in any single template (sizes the per-ticket uniform draws)
+    MAX_TEMPLATE_FIELDS = max(len(fields) for options in COMPILED_TEMPLATES.values() for _, fields in options)
     
     def __init__(self, seed: int = 42):
         """Initialize generator with random seed for reproducibility."""
-        random.seed(seed)
-        np.random.seed(seed)
+        # Single PCG64 stream shared by every draw
+        self.rng = np.random.default_rng(seed)
         logger.info("TicketDataGenerator initialized with UAE context")
     
     def generate_emirates_id(self) -> str:
         """Generate realistic UAE Emirates ID number."""
         # Format: 784-YYYY-XXXXXXX-X
-        year = random.randint(1980, 2005)
-        sequence = ''.join([str(random.randint(0, 9)) for _ in range(7)])
-        check_digit = random.randint(1, 9)
-        return f"784-{year}-{sequence}-{check_digit}"
+        return self.generate_emirates_ids(1)[0]
     
     def generate_phone_number(self) -> str:
         """Generate realistic UAE phone number."""
-        # UAE mobile prefixes
-        prefixes = ["50", "52", "54", "55", "56", "58"]
-        prefix = random.choice(prefixes)
-        number = ''.join([str(random.randint(0, 9)) for _ in range(7)])
-        return f"+971{prefix}{number}"
+        return self.generate_phone_numbers(1)[0]
     
-    def generate_ticket_text(self, category: str, sentiment: str, entity: str) -> str:
-        """Generate realistic ticket text based on category and sentiment."""
-        templates = self.TICKET_TEMPLATES[category][sentiment]
-        template = random.choice(templates)
-        
-        # Fill template with appropriate values
-        replacements = {
-            "{facility}": random.choice(self.FACILITIES),
-            "{area}": random.choice(self.UAE_LOCATIONS),
-            "{location}": random.choice(self.UAE_LOCATIONS),
-            "{entity}": entity,
-            "{duration}": f"{random.randint(1, 24)} hours",
-            "{time}": f"{random.randint(1, 12)}:{random.choice(['00', '30'])}",
-            "{system}": random.choice(["portal", "app", "website", "payment system"]),
-            "{operation}": random.choice(["renewal", "payment", "registration", "booking"]),
-            "{period}": random.choice(["November", "December", "last month", "Q4 2024"]),
-            "{service}": random.choice(["internet", "electricity", "water", "mobile"]),
-            "{process}": random.choice(["renewal", "application", "registration", "payment"]),
-            "{application}": random.choice(["Emirates ID", "visa", "license", "permit"]),
-            "{topic}": random.choice(["charges", "requirements", "status", "documents"]),
-            "{issue}": random.choice(["fees", "timeline", "requirements", "process"]),
-            "{hazard}": random.choice(["gas leak", "fire", "electrical hazard", "structural damage"]),
-            "{situation}": random.choice(["construction", "public event", "school zone", "parking"])
-        }
+    def generate_emirates_ids(self, count: int) -> List[str]:
+        """Generate `count` Emirates IDs from three vectorized draws."""
+        years = self.rng.integers(1980, 2006, count).tolist()
+        sequences = self.rng.integers(0, 10_000_000, count).tolist()
+        check_digits = self.rng.integers(1, 10, count).tolist()
+        return [f"784-{year}-{sequence:07d}-{check}"
+                for year, sequence, check in zip(years, sequences, check_digits)]
+    
+    def generate_phone_numbers(self, count: int) -> List[str]:
+        """Generate `count` UAE mobile numbers from two vectorized draws."""
+        prefixes = self.rng.choice(self.MOBILE_PREFIXES, count).tolist()
+        numbers = self.rng.integers(0, 10_000_000, count).tolist()
+        return [f"+971{prefix}{number:07d}" for prefix, number in zip(prefixes, numbers)]
+    
+    def generate_ticket_text(self, category: str, sentiment: str, entity: str,
+                             picks: Optional[List[float]] = None) -> str:
+        """
+        Generate realistic ticket text based on category and sentiment.
         
-        text = template
-        for key, value in replacements.items():
-            text = text.replace(key, value)
+        `picks` are uniform draws in [0, 1): the first selects the template and the
+        rest fill its placeholders in order. Batch callers pass rows of a pre-drawn
+        matrix; otherwise they are drawn here.
+        """
+        if picks is None:
+            picks = self.rng.random(1 + self.MAX_TEMPLATE_FIELDS).tolist()
+        options = self.COMPILED_TEMPLATES[(category, sentiment)]
+        template, fields = options[int(picks[0] * len(options))]
         
-        return text
+        # Sample values only for the placeholders this template uses
+        values = {}
+        for field, pick in zip(fields, picks[1:]):
+            if field == "entity":
+                values[field] = entity
+            else:
+                pool = self.SLOT_VALUES[field]
+                values[field] = pool[int(pick * len(pool))]
+        return template.format_map(values)
     
     def determine_priority(self, category: str, sentiment: str) -> str:
         """Determine priority based on category and sentiment."""
-        if category == "Safety / Emergency":
-            return "Critical" if sentiment == "Negative" else "High"
-        elif category == "Technical / IT":
-            if sentiment == "Negative":
-                return random.choice(["High", "Medium"])
-            return "Medium"
-        elif category == "Billing":
-            return "Medium"
-        elif category == "Facilities":
-            return "High" if sentiment == "Negative" else random.choice(["Medium", "Low"])
-        else:  # Inquiry
-            return "Low"
+        return self.determine_priorities(category, [sentiment])[0]
+    
+    def determine_priorities(self, category: str, sentiments: List[str]) -> List[str]:
+        """Priorities for a block of same-category tickets using one vectorized draw."""
+        rules = [self.PRIORITY_RULES[(category, sentiment)] for sentiment in sentiments]
+        picks = self.rng.random(len(rules)).tolist()
+        return [options[int(pick * len(options))] for options, pick in zip(rules, picks)]
     
     def generate_tickets(self, num_tickets: int = 150) -> pd.DataFrame:
         """
@@ -242,54 +315,62 @@ class TicketDataGenerator:
         """
         logger.info(f"Generating {num_tickets} synthetic tickets for UAE context...")
         
-        tickets = []
+        rng = self.rng
+        
+        # Column-wise buffers, filled one category block at a time
+        texts, categories, sentiment_col, priorities = [], [], [], []
+        entity_col, emirates_ids, phone_numbers = [], [], []
         
         # Ensure balanced distribution
         tickets_per_category = num_tickets // len(self.CATEGORIES)
         
         for category in self.CATEGORIES:
-            for _ in range(tickets_per_category):
-                # Select sentiment with realistic distribution
-                sentiment_weights = [0.2, 0.3, 0.5]  # 20% Positive, 30% Neutral, 50% Negative
-                sentiment = random.choices(self.SENTIMENTS, weights=sentiment_weights)[0]
-                
-                # Select appropriate entity for category
-                if category == "Safety / Emergency":
-                    entity = random.choice(["Civil Defense", "DHA", "RTA", "Municipality"])
-                elif category == "Technical / IT":
-                    entity = random.choice(["Etisalat", "RTA", "Tasheel", "DEWA", "Du"])
-                elif category == "Billing":
-                    entity = random.choice(["DEWA", "Etisalat", "Du", "RTA"])
-                elif category == "Facilities":
-                    entity = random.choice(["Dubai Municipality", "RTA", "DEWA", "Sharjah Municipality"])
-                else:  # Inquiry
-                    entity = random.choice(self.UAE_ENTITIES)
-                
-                # Generate ticket
-                ticket_id = len(tickets) + 1
-                text = self.generate_ticket_text(category, sentiment, entity)
-                priority = self.determine_priority(category, sentiment)
-                
-                # Generate PII data (sometimes empty for realism)
-                emirates_id = self.generate_emirates_id() if random.random() > 0.3 else ""
-                phone_number = self.generate_phone_number() if random.random() > 0.2 else ""
-                
-                tickets.append({
-                    "ticket_id": ticket_id,
-                    "text": text,
-                    "category": category,
-                    "sentiment": sentiment,
-                    "priority": priority,
-                    "government_entity": entity,
-                    "emirates_id": emirates_id,
-                    "phone_number": phone_number
-                })
+            entity_pool = self.CATEGORY_ENTITIES[category]
+            
+            # Draw each random attribute for the whole category in one vectorized call
+            sentiments = rng.choice(self.SENTIMENTS, tickets_per_category, p=self.SENTIMENT_WEIGHTS).tolist()
+            entities = rng.choice(entity_pool, tickets_per_category).tolist()
+            # PII presence masks (sometimes empty for realism)
+            has_emirates_id = (rng.random(tickets_per_category) > 0.3).tolist()
+            has_phone = (rng.random(tickets_per_category) > 0.2).tolist()
+            
+            # One uniform row per ticket for template and placeholder selection
+            picks = rng.random((tickets_per_category, 1 + self.MAX_TEMPLATE_FIELDS)).tolist()
+            texts.extend(self.generate_ticket_text(category, sentiment, entity, row_picks)
+                         for sentiment, entity, row_picks in zip(sentiments, entities, picks))
+            priorities.extend(self.determine_priorities(category, sentiments))
+            emirates_ids.extend(emirates_id if with_id else ""
+                                for emirates_id, with_id in zip(self.generate_emirates_ids(tickets_per_category), has_emirates_id))
+            phone_numbers.extend(phone if with_phone else ""
+                                 for phone, with_phone in zip(self.generate_phone_numbers(tickets_per_category), has_phone))
+            categories.extend([category] * tickets_per_category)
+            sentiment_col.extend(sentiments)
+            entity_col.extend(entities)
         
-        # Create DataFrame
-        df = pd.DataFrame(tickets)
+        # Shuffle by permuting each column once, instead of building and resampling a second frame
+        order = rng.permutation(len(texts))
+        columns = {
+            "text": texts,
+            "category": categories,
+            "sentiment": sentiment_col,
+            "priority": priorities,
+            "government_entity": entity_col,
+            "emirates_id": emirates_ids,
+            "phone_number": phone_numbers
+        }
+        shuffled = {name: np.asarray(values, dtype=object)[order] for name, values in columns.items()}
         
-        # Shuffle the data
-        df = df.sample(frac=1, random_state=42).reset_index(drop=True)
+        # Create DataFrame straight from the columns; repeated labels become categoricals
+        df = pd.DataFrame({
+            "ticket_id": (order + 1).astype(np.int32),
+            "text": pd.array(shuffled["text"], dtype=STRING_DTYPE),
+            "category": pd.Categorical(shuffled["category"], categories=self.CATEGORIES),
+            "sentiment": pd.Categorical(shuffled["sentiment"], categories=self.SENTIMENTS),
+            "priority": pd.Categorical(shuffled["priority"], categories=self.PRIORITIES),
+            "government_entity": pd.Categorical(shuffled["government_entity"], categories=self.ENTITY_NAMES),
+            "emirates_id": pd.array(shuffled["emirates_id"], dtype=STRING_DTYPE),
+            "phone_number": pd.array(shuffled["phone_number"], dtype=STRING_DTYPE)
+        })
         
         logger.info(f"Generated {len(df)} synthetic tickets with balanced distribution")
         logger.info("Category distribution:")
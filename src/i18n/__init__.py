@@ -0,0 +1,30 @@
+"""
+Per-language UI translation tables for the Streamlit application
+Each language lives in its own module and is only imported when first requested
+"""
+
+import importlib
+import sys
+from functools import lru_cache
+
+SUPPORTED_LANGUAGES = ("en", "ar")
+
+
+class TranslationTable(dict):
+    """Translation dict whose lookups fall back to the key itself, so
+    `table[key]` (and the bound `table.__getitem__`) never raises."""
+    
+    def __missing__(self, key: str) -> str:
+        return key
+
+
+@lru_cache(maxsize=len(SUPPORTED_LANGUAGES))
+def load_table(language: str) -> TranslationTable:
+    """Import a language module on demand and return its key-interned table."""
+    module = importlib.import_module(f"{__name__}.{language}")
+    return TranslationTable((sys.intern(key), value) for key, value in module.TABLE.items())
+
+
+def translate(key: str, language: str) -> str:
+    """Stateless lookup of `key` in `language` (falls back to the key itself)."""
+    return load_table(language)[key]
@@ -0,0 +1,118 @@
+"""
+Arabic UI strings for the UAE Government AI Ticket Triage application
+نصوص واجهة المستخدم العربية
+"""
+
+TABLE = {
+    # Application
+    "app_title": "نظام تصنيف التذاكر الحكومي بالذكاء الاصطناعي",
+    "app_subtitle": "وزارة الذكاء الاصطناعي • منصة آمنة",
+
+    # Navigation
+    "tab_analyze": "📝 تحليل التذاكر",
+    "tab_history": "📚 سجل التذاكر",
+
+    # Sidebar
+    "sidebar_system": "عناصر تحكم النظام",
+    "sidebar_language": "اختيار اللغة",
+    "sidebar_threshold": "حد الثقة",
+    "sidebar_threshold_help": "الحد الأدنى للثقة للمعالجة التلقائية",
+    "sidebar_user_role": "دور المستخدم",
+    "sidebar_analyst": "محلل",
+    "sidebar_supervisor": "مشرف",
+    "sidebar_admin": "مسؤول",
+    "sidebar_stats": "إحصائيات النظام",
+    "sidebar_processed": "التذاكر المعالجة",
+    "sidebar_accuracy": "متوسط الثقة",
+    "sidebar_actions": "إجراءات النظام",
+    "sidebar_clear": "🔄 مسح السجل",
+    "sidebar_view_logs": "📊 عرض سجلات التدقيق",
+    "sidebar_status": "حالة النظام",
+    "sidebar_ai_models": "نماذج الذكاء الاصطناعي",
+    "sidebar_security": "الأمان",
+    "sidebar_pii": "حماية المعلومات الشخصية",
+    "sidebar_audit": "تسجيل التدقيق",
+
+    # Ticket Input
+    "section_examples": "تذاكر مثال",
+    "section_input": "أدخل تفاصيل التذكرة",
+    "example_select": "اختر تذكرة مثال:",
+    "input_label": "نص التذكرة",
+    "input_placeholder": "أدخل وصفاً مفصلاً للتذكرة...",
+    "btn_analyze": "🔍 تحليل التذكرة",
+    "btn_clear": "🧹 مسح المدخلات",
+    "input_stats": "الحروف: {} | الكلمات: {}",
+
+    # Example Tickets
+    "example_emergency": "🚨 حالة طوارئ",
+    "example_emergency_desc": "مشكلة سلامة حرجة تتطلب اهتماماً فورياً",
+    "example_technical": "💻 مشكلة تقنية",
+    "example_technical_desc": "مشكلة تقنية في البوابة الحكومية",
+    "example_billing": "💰 مشكلة فاتورة",
+    "example_billing_desc": "تحقيق في تناقض فاتورة المواطن",
+    "example_facilities": "🏢 طلب مرافق",
+    "example_facilities_desc": "طلب صيانة مبنى حكومي",
+    "example_inquiry": "📋 استفسار خدمة",
+    "example_inquiry_desc": "طلب خدمة المواطن للوثائق",
+
+    # Analysis Results
+    "results_title": "نتائج تحليل التذكرة",
+    "results_ticket_id": "رقم التذكرة",
+    "results_priority": "مستوى الأولوية",
+    "results_response_time": "وقت الاستجابة",
+    "results_department": "القسم",
+    "results_confidence": "ثقة الذكاء الاصطناعي",
+    "results_confidence_high": "ثقة عالية",
+    "results_confidence_medium": "ثقة متوسطة",
+    "results_confidence_low": "ثقة منخفضة",
+    "results_sentiment": "مشاعر المواطن",
+    "results_category": "الفئة",
+    "results_manual_review": "مراجعة يدوية مطلوبة",
+    "results_auto_processing": "تمت الموافقة على المعالجة التلقائية",
+    "results_dissatisfaction": "تم اكتشاف عدم رضا المواطن",
+    "results_positive_feedback": "تم استقبال تعليقات إيجابية",
+
+    # Department
+    "dept_assignment": "تعيين القسم",
+    "dept_supervisor": "المشرف",
+    "dept_contact": "معلومات الاتصال",
+    "dept_phone": "الهاتف",
+    "dept_email": "البريد الإلكتروني",
+    "dept_action_required": "إجراء مطلوب",
+
+    # Actions
+    "actions_title": "الإجراءات المطلوبة",
+    "action_emergency": "🚨 تفعيل بروتوكول الاستجابة للطوارئ",
+    "action_technical": "💻 تعيين لفريق الدعم التقني",
+    "action_billing": "💰 تحويل لقسم المالية",
+    "action_facilities": "🔧 تعيين لفريق الصيانة",
+    "action_inquiry": "📞 التواصل مع المواطن للتوضيح",
+    "action_standard": "طابور المعالجة القياسي",
+
+    # History Table
+    "history_title": "سجل التذاكر",
+    "history_time": "الوقت",
+    "history_ticket_id": "رقم التذكرة",
+    "history_category": "الفئة",
+    "history_priority": "الأولوية",
+    "history_status": "الحالة",
+    "history_ai_action": "الإجراء المقترح من الذكاء الاصطناعي",
+    "history_no_data": "لا يوجد سجل تذاكر متاح",
+    "history_summary": "ملخص السجل",
+    "history_total": "إجمالي التذاكر",
+    "history_avg_conf": "متوسط الثقة",
+    "history_critical": "الحالات الحرجة",
+    "history_manual": "المراجعات اليدوية",
+
+    # Status Messages
+    "status_processing": "جاري تحليل التذكرة بنماذج الذكاء الاصطناعي...",
+    "status_complete": "اكتمل التحليل!",
+    "status_error_empty": "الرجاء إدخال نص التذكرة",
+    "status_error_models": "لم يتم تحميل نماذج الذكاء الاصطناعي. الرجاء تدريب النماذج أولاً.",
+    "status_success": "تم معالجة التذكرة بنجاح",
+
+    # Footer
+    "footer_title": "وزارة الذكاء الاصطناعي في الإمارات",
+    "footer_subtitle": "مبادرة الحكومة الذكية • إنتاج آمن",
+    "footer_copyright": "© 2024 حكومة الإمارات العربية المتحدة",
+}
@@ -0,0 +1,117 @@
+"""
+English UI strings for the UAE Government AI Ticket Triage application
+"""
+
+TABLE = {
+    # Application
+    "app_title": "UAE Government AI Ticket Triage System",
+    "app_subtitle": "Ministry of Artificial Intelligence • Secure Platform",
+
+    # Navigation
+    "tab_analyze": "📝 Ticket Analysis",
+    "tab_history": "📚 Ticket History",
+
+    # Sidebar
+    "sidebar_system": "System Controls",
+    "sidebar_language": "Language Selection",
+    "sidebar_threshold": "Confidence Threshold",
+    "sidebar_threshold_help": "Minimum confidence for automatic processing",
+    "sidebar_user_role": "User Role",
+    "sidebar_analyst": "Analyst",
+    "sidebar_supervisor": "Supervisor",
+    "sidebar_admin": "Administrator",
+    "sidebar_stats": "System Statistics",
+    "sidebar_processed": "Tickets Processed",
+    "sidebar_accuracy": "Average Confidence",
+    "sidebar_actions": "System Actions",
+    "sidebar_clear": "🔄 Clear History",
+    "sidebar_view_logs": "📊 View Audit Logs",
+    "sidebar_status": "System Status",
+    "sidebar_ai_models": "AI Models",
+    "sidebar_security": "Security",
+    "sidebar_pii": "PII Protection",
+    "sidebar_audit": "Audit Logging",
+
+    # Ticket Input
+    "section_examples": "Example Tickets",
+    "section_input": "Enter Ticket Details",
+    "example_select": "Select an example ticket:",
+    "input_label": "Ticket Text",
+    "input_placeholder": "Enter detailed ticket description...",
+    "btn_analyze": "🔍 Analyze Ticket",
+    "btn_clear": "🧹 Clear Input",
+    "input_stats": "Characters: {} | Words: {}",
+
+    # Example Tickets
+    "example_emergency": "🚨 Emergency Case",
+    "example_emergency_desc": "Critical safety issue requiring immediate attention",
+    "example_technical": "💻 Technical Issue",
+    "example_technical_desc": "Government portal technical issue",
+    "example_billing": "💰 Billing Problem",
+    "example_billing_desc": "Citizen billing discrepancy investigation",
+    "example_facilities": "🏢 Facilities Request",
+    "example_facilities_desc": "Government building maintenance request",
+    "example_inquiry": "📋 Service Inquiry",
+    "example_inquiry_desc": "Citizen service request for documents",
+
+    # Analysis Results
+    "results_title": "Ticket Analysis Results",
+    "results_ticket_id": "Ticket ID",
+    "results_priority": "Priority Level",
+    "results_response_time": "Response Time",
+    "results_department": "Department",
+    "results_confidence": "AI Confidence",
+    "results_confidence_high": "High Confidence",
+    "results_confidence_medium": "Medium Confidence",
+    "results_confidence_low": "Low Confidence",
+    "results_sentiment": "Citizen Sentiment",
+    "results_category": "Category",
+    "results_manual_review": "Manual Review Required",
+    "results_auto_processing": "Auto-Processing Approved",
+    "results_dissatisfaction": "Citizen Dissatisfaction Detected",
+    "results_positive_feedback": "Positive Feedback Received",
+
+    # Department
+    "dept_assignment": "Department Assignment",
+    "dept_supervisor": "Supervisor",
+    "dept_contact": "Contact Information",
+    "dept_phone": "Phone",
+    "dept_email": "Email",
+    "dept_action_required": "Action Required",
+
+    # Actions
+    "actions_title": "Required Actions",
+    "action_emergency": "🚨 Activate emergency response protocol",
+    "action_technical": "💻 Assign to IT support team",
+    "action_billing": "💰 Forward to finance department",
+    "action_facilities": "🔧 Assign maintenance team",
+    "action_inquiry": "📞 Contact citizen for clarification",
+    "action_standard": "Standard processing queue",
+
+    # History Table
+    "history_title": "Ticket History",
+    "history_time": "Time",
+    "history_ticket_id": "Ticket ID",
+    "history_category": "Category",
+    "history_priority": "Priority",
+    "history_status": "Status",
+    "history_ai_action": "AI Suggested Action",
+    "history_no_data": "No ticket history available",
+    "history_summary": "History Summary",
+    "history_total": "Total Tickets",
+    "history_avg_conf": "Average Confidence",
+    "history_critical": "Critical Cases",
+    "history_manual": "Manual Reviews",
+
+    # Status Messages
+    "status_processing": "Analyzing ticket with AI models...",
+    "status_complete": "Analysis complete!",
+    "status_error_empty": "Please enter ticket text",
+    "status_error_models": "AI models not loaded. Please train models first.",
+    "status_success": "Ticket processed successfully",
+
+    # Footer
+    "footer_title": "UAE Ministry of Artificial Intelligence",
+    "footer_subtitle": "Smart Government Initiative • Secure Production",
+    "footer_copyright": "© 2024 United Arab Emirates Government",
+}
@@ -7,8 +7,10 @@ Production-grade model training with enterprise safeguards
 
 import pandas as pd
 import numpy as np
+import os
 import joblib
 import logging
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Tuple, Dict, Any
@@ -29,12 +31,51 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def decision_to_proba(classifier: LogisticRegression, scores: np.ndarray) -> np.ndarray:
+    """
+    Class probabilities from decision_function scores, normalized the way
+    LogisticRegression.predict_proba does (one-vs-rest for liblinear and
+    binary problems, softmax otherwise).
+    """
+    if scores.ndim == 1:
+        # Binary: scores belong to classes_[1]; [-s, s] through the sigmoid gives [1 - p, p]
+        scores = np.column_stack([-scores, scores])
+    elif classifier.solver != 'liblinear':
+        exp_scores = np.exp(scores - scores.max(axis=1, keepdims=True))
+        return exp_scores / exp_scores.sum(axis=1, keepdims=True)
+    proba = 1.0 / (1.0 + np.exp(-scores))
+    return proba / proba.sum(axis=1, keepdims=True)
+
+
+def dump_atomic(obj: Any, path: Path):
+    """
+    Dump obj to a temp file next to path, then os.replace it into place.
+    The running app memory-maps the model files; writing in place would truncate
+    pages it still maps (SIGBUS or corrupt models). Replacing swaps the directory
+    entry, so existing mappings keep the old inode until they are released.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        joblib.dump(obj, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
 class ModelTrainer:
     """
     Production-grade model trainer for UAE government ticket classification.
     Implements separate models for category classification and sentiment analysis.
     """
     
+    # Label columns and how they are described in the training log
+    TARGET_DESCRIPTIONS = {
+        'category': 'category classification',
+        'sentiment': 'sentiment analysis',
+    }
+    
     def __init__(self, data_path: str = "data/tickets_synthetic_v2.csv"):
         """
         Initialize the model trainer.
@@ -47,6 +88,8 @@ class ModelTrainer:
         self.category_model = None
         self.sentiment_model = None
         self.vectorizer = None
+        self.features = None
+        self.split = None
         self.models_dir = Path("../models")
         
         # Create models directory if it doesn't exist
@@ -58,6 +101,7 @@ class ModelTrainer:
         """Load and prepare the synthetic ticket data."""
         try:
             self.data = pd.read_csv(self.data_path)
+            self.features = self.split = None  # Stale once the corpus changes
             logger.info(f"Loaded {len(self.data)} tickets from {self.data_path}")
             
             # Basic data validation
@@ -67,8 +111,8 @@ class ModelTrainer:
             if missing_cols:
                 raise ValueError(f"Missing required columns: {missing_cols}")
             
-            # Clean text data
-            self.data['text_clean'] = self.data['text'].str.lower().str.strip()
+            # No separate cleaned column: TfidfVectorizer lowercases (lowercase=True) and its
+            # token pattern ignores surrounding whitespace, so raw text yields the same features
             
             # Verify distribution
             logger.info("Data distribution:")
@@ -81,12 +125,12 @@ class ModelTrainer:
             logger.error(f"Error loading data: {e}")
             raise
     
-    def create_ml_pipeline(self) -> Pipeline:
+    def create_ml_pipeline(self) -> Tuple[TfidfVectorizer, LogisticRegression]:
         """
-        Create ML pipeline with TF-IDF vectorizer and Logistic Regression.
+        Create the TF-IDF vectorizer and Logistic Regression stages of the ML pipeline.
         
         Returns:
-            Configured scikit-learn Pipeline
+            Tuple of (vectorizer, classifier), both unfitted
         """
         # TF-IDF Vectorizer with parameters optimized for ticket text
         vectorizer = TfidfVectorizer(
@@ -95,60 +139,100 @@ class ModelTrainer:
             max_df=0.95,
             ngram_range=(1, 2),
             stop_words='english',
-            sublinear_tf=True  # Use 1 + log(tf) instead of raw tf
+            sublinear_tf=True,  # Use 1 + log(tf) instead of raw tf
+            dtype=np.float32  # Halves feature memory; SAGA trains on float32 without upcasting
         )
         
         # Logistic Regression with balanced class weights
         classifier = LogisticRegression(
-            max_iter=1000,
+            max_iter=200,
+            tol=1e-3,
             random_state=42,
             class_weight='balanced',
-            solver='liblinear',  # Good for small to medium datasets
+            solver='saga',  # Native multinomial loss, fast on sparse TF-IDF
             C=1.0,
             penalty='l2'
         )
         
-        # Create pipeline
-        pipeline = Pipeline([
-            ('vectorizer', vectorizer),
-            ('classifier', classifier)
-        ])
+        return vectorizer, classifier
+    
+    def fit_vectorizer(self):
+        """
+        Fit one TF-IDF vectorizer on the full corpus and transform it once.
+        Both models train on these shared features, so tokenization and the
+        IDF pass run a single time.
+        """
+        self.vectorizer, _ = self.create_ml_pipeline()
+        self.features = self.vectorizer.fit_transform(self.data['text'].values)
+        logger.info(f"Vectorized corpus: {self.features.shape[0]} tickets x {self.features.shape[1]} features")
+        return self.features
+    
+    def split_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute one train/test split of row indices shared by both models.
+        It is stratified on the joint category/sentiment label so both tasks keep
+        their class balance; if some combination is too rare for that, it falls
+        back to stratifying on category alone.
         
-        return pipeline
+        Returns:
+            Tuple of (train_indices, test_indices)
+        """
+        indices = np.arange(len(self.data))
+        joint_labels = self.data['category'].astype(str) + '|' + self.data['sentiment'].astype(str)
+        try:
+            self.split = train_test_split(indices, test_size=0.2, random_state=42, stratify=joint_labels)
+        except ValueError:
+            logger.warning("Rare category/sentiment combinations - stratifying the split on category only")
+            self.split = train_test_split(indices, test_size=0.2, random_state=42, stratify=self.data['category'])
+        return self.split
     
-    def train_category_model(self) -> Tuple[Pipeline, Dict[str, Any]]:
+    def _train_one(self, target: str) -> Tuple[Pipeline, Dict[str, Any]]:
         """
-        Train model for ticket category classification.
+        Train and evaluate the classifier for one target column.
         
+        Args:
+            target: Label column to predict ('category' or 'sentiment')
+            
         Returns:
             Tuple of (trained_pipeline, metrics_dict)
         """
-        logger.info("Training category classification model...")
-        
-        # Prepare data
-        X = self.data['text_clean'].values
-        y = self.data['category'].values
-        
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42, stratify=y
-        )
-        
-        # Create and train pipeline
-        pipeline = self.create_ml_pipeline()
-        pipeline.fit(X_train, y_train)
-        
-        # Evaluate
-        y_pred = pipeline.predict(X_test)
-        y_pred_proba = pipeline.predict_proba(X_test)
+        logger.info(f"Training {self.TARGET_DESCRIPTIONS[target]} model...")
+        
+        # Prepare data (shared TF-IDF features)
+        if self.features is None:
+            self.fit_vectorizer()
+        X = self.features
+        y = self.data[target].values
+        
+        # Split data (shared row indices, so the sparse matrix is only sliced)
+        if self.split is None:
+            self.split_data()
+        train_idx, test_idx = self.split
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
+        
+        # Train classifier on the pre-vectorized split
+        _, classifier = self.create_ml_pipeline()
+        classifier.fit(X_train, y_train)
+        
+        # Inference-only weights in float32 to match the float32 TF-IDF features
+        # (a no-op copy-wise when SAGA already produced float32 coefficients)
+        classifier.coef_ = classifier.coef_.astype(np.float32, copy=False)
+        classifier.intercept_ = classifier.intercept_.astype(np.float32, copy=False)
+        
+        # Evaluate with one forward pass: labels and probabilities both come from the decision scores
+        scores = classifier.decision_function(X_test)
+        y_pred_proba = decision_to_proba(classifier, scores)
+        y_pred = classifier.classes_[y_pred_proba.argmax(axis=1)]
         
         # Calculate metrics
         accuracy = accuracy_score(y_test, y_pred)
         report = classification_report(y_test, y_pred, output_dict=True)
         
-        # Calculate confidence metrics
-        avg_confidence = np.max(y_pred_proba, axis=1).mean()
-        confidence_std = np.max(y_pred_proba, axis=1).std()
+        # Calculate confidence metrics from one pass over the probability matrix
+        max_proba = y_pred_proba.max(axis=1)
+        avg_confidence = float(max_proba.mean())
+        confidence_std = float(max_proba.std())
         
         metrics = {
             'accuracy': accuracy,
@@ -157,13 +241,29 @@ class ModelTrainer:
             'f1_score': report['weighted avg']['f1-score'],
             'avg_confidence': avg_confidence,
             'confidence_std': confidence_std,
-            'test_samples': len(X_test),
+            'test_samples': X_test.shape[0],
             'training_date': datetime.now().isoformat()
         }
         
-        logger.info(f"Category model accuracy: {accuracy:.3f}")
+        logger.info(f"{target.capitalize()} model accuracy: {accuracy:.3f}")
         logger.info(f"Average confidence: {avg_confidence:.3f} ± {confidence_std:.3f}")
         
+        # Persist as a full pipeline so the inference API is unchanged
+        pipeline = Pipeline([
+            ('vectorizer', self.vectorizer),
+            ('classifier', classifier)
+        ])
+        
+        return pipeline, metrics
+    
+    def train_category_model(self) -> Tuple[Pipeline, Dict[str, Any]]:
+        """
+        Train model for ticket category classification.
+        
+        Returns:
+            Tuple of (trained_pipeline, metrics_dict)
+        """
+        pipeline, metrics = self._train_one('category')
         self.category_model = pipeline
         return pipeline, metrics
     
@@ -174,47 +274,7 @@ class ModelTrainer:
         Returns:
             Tuple of (trained_pipeline, metrics_dict)
         """
-        logger.info("Training sentiment analysis model...")
-        
-        # Prepare data
-        X = self.data['text_clean'].values
-        y = self.data['sentiment'].values
-        
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42, stratify=y
-        )
-        
-        # Create and train pipeline
-        pipeline = self.create_ml_pipeline()
-        pipeline.fit(X_train, y_train)
-        
-        # Evaluate
-        y_pred = pipeline.predict(X_test)
-        y_pred_proba = pipeline.predict_proba(X_test)
-        
-        # Calculate metrics
-        accuracy = accuracy_score(y_test, y_pred)
-        report = classification_report(y_test, y_pred, output_dict=True)
-        
-        # Calculate confidence metrics
-        avg_confidence = np.max(y_pred_proba, axis=1).mean()
-        confidence_std = np.max(y_pred_proba, axis=1).std()
-        
-        metrics = {
-            'accuracy': accuracy,
-            'precision': report['weighted avg']['precision'],
-            'recall': report['weighted avg']['recall'],
-            'f1_score': report['weighted avg']['f1-score'],
-            'avg_confidence': avg_confidence,
-            'confidence_std': confidence_std,
-            'test_samples': len(X_test),
-            'training_date': datetime.now().isoformat()
-        }
-        
-        logger.info(f"Sentiment model accuracy: {accuracy:.3f}")
-        logger.info(f"Average confidence: {avg_confidence:.3f} ± {confidence_std:.3f}")
-        
+        pipeline, metrics = self._train_one('sentiment')
         self.sentiment_model = pipeline
         return pipeline, metrics
     
@@ -225,14 +285,21 @@ class ModelTrainer:
             return False
         
         try:
-            # Save category model
+            # stop_words_ records every term pruned by min_df/max_df/max_features and is
+            # only kept for introspection - drop it so it is not pickled with each model
+            for pipeline in (self.category_model, self.sentiment_model):
+                vectorizer = pipeline.named_steps['vectorizer']
+                if getattr(vectorizer, 'stop_words_', None) is not None:
+                    vectorizer.stop_words_ = None
+            
+            # Save category model (uncompressed, so the processor can memory-map its arrays)
             category_path = self.models_dir / "category_model.pkl"
-            joblib.dump(self.category_model, category_path)
+            dump_atomic(self.category_model, category_path)
             logger.info(f"Saved category model to {category_path}")
             
             # Save sentiment model
             sentiment_path = self.models_dir / "sentiment_model.pkl"
-            joblib.dump(self.sentiment_model, sentiment_path)
+            dump_atomic(self.sentiment_model, sentiment_path)
             logger.info(f"Saved sentiment model to {sentiment_path}")
             
             return True
@@ -250,10 +317,12 @@ class ModelTrainer:
         """
         logger.info("Starting comprehensive model training...")
         
-        # Load data
+        # Load data, then vectorize and split it once for both models
         self.load_data()
+        self.fit_vectorizer()
+        self.split_data()
         
-        # Train models
+        # Train models on the shared features
         category_pipeline, category_metrics = self.train_category_model()
         sentiment_pipeline, sentiment_metrics = self.train_sentiment_model()
         
@@ -291,12 +360,15 @@ def validate_models():
         print("🔍 Model Validation Results:")
         print("-" * 50)
         
-        for text in test_texts:
-            category = category_model.predict([text])[0]
-            category_conf = category_model.predict_proba([text]).max()
-            sentiment = sentiment_model.predict([text])[0]
-            sentiment_conf = sentiment_model.predict_proba([text]).max()
-            
+        # Score all samples with one predict_proba per model; labels are the argmax class
+        category_proba = category_model.predict_proba(test_texts)
+        sentiment_proba = sentiment_model.predict_proba(test_texts)
+        categories = category_model.classes_[category_proba.argmax(axis=1)]
+        sentiments = sentiment_model.classes_[sentiment_proba.argmax(axis=1)]
+        
+        for text, category, category_conf, sentiment, sentiment_conf in zip(
+            test_texts, categories, category_proba.max(axis=1), sentiments, sentiment_proba.max(axis=1)
+        ):
             print(f"Text: '{text}'")
             print(f"  Category: {category} (confidence: {category_conf:.3f})")
             print(f"  Sentiment: {sentiment} (confidence: {sentiment_conf:.3f})")
@@ -5,9 +5,17 @@ Author: Principal AI/ML Engineer
 Production-grade ticket processing with PII protection and safety overrides
 """
 
+import os
 import re
+import time
+import hashlib
+import atexit
+import threading
 import joblib
 import logging
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
@@ -24,53 +32,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Loaded pipelines by resolved path, with the file stamp they were loaded from;
+# shared by every TicketProcessor in the process
+_MODEL_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def load_model(path: Path) -> Any:
+    """
+    Load a pickled pipeline once per file version.
+    Numpy arrays inside the pickle are memory-mapped read-only, so forked
+    workers share the same pages instead of each holding a private copy.
+    A retrained model (new inode or mtime) replaces the cached one.
+    """
+    key = str(path.resolve())
+    stat = path.stat()
+    stamp = (stat.st_ino, stat.st_mtime_ns)
+    cached = _MODEL_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    model = joblib.load(path, mmap_mode='r')
+    _MODEL_CACHE[key] = (stamp, model)
+    return model
+
+
+def text_digest(text: str) -> int:
+    """
+    Stable 64-bit digest of a ticket's text.
+    Unlike the builtin hash(), it is not salted per process, so the same text
+    gets the same ticket ID suffix in every worker and across restarts.
+    """
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
 
 class PIIProtector:
     """
     UAE-specific PII detection and masking for Emirates ID and phone numbers.
     """
     
-    EMIRATES_ID_PATTERN = r'\b784-\d{4}-\d{7}-\d\b'
-    PHONE_PATTERNS = [
-        r'\+\d{10,15}',
-        r'\b05\d-\d{7}\b',
-        r'\b05\d{8}\b',
-        r'\b\+9715\d{8}\b'
-    ]
+    # Compiled once at class load; groups keep the prefix, birth year and check digit
+    EMIRATES_ID_PATTERN = re.compile(r'\b(784)-(\d{4})-\d{7}-(\d)\b')
+    # International, 05X-XXXXXXX and 05XXXXXXXX numbers in one alternation, scanned once
+    # (+9715XXXXXXXX numbers are already covered by the international branch)
+    PHONE_PATTERN = re.compile(r'\+\d{10,15}|\b05\d-\d{7}\b|\b05\d{8}\b')
+    
+    @staticmethod
+    def _mask_emirates_id_match(match: 're.Match[str]') -> str:
+        return f"{match.group(1)}-{match.group(2)}-XXX-{match.group(3)}"
+    
+    @staticmethod
+    def _mask_phone_match(match: 're.Match[str]') -> str:
+        number = match.group(0)
+        if number.startswith('+971'):
+            return "+971-XXX-XXXX"
+        elif number.startswith('05'):
+            return "05X-XXX-XXXX"
+        return "XXX-XXX-XXXX"
     
     @staticmethod
     def mask_emirates_id(text: str) -> Tuple[str, List[str]]:
-        detected_ids = re.findall(PIIProtector.EMIRATES_ID_PATTERN, text)
-        masked_text = text
-        
-        for eid in detected_ids:
-            parts = eid.split('-')
-            if len(parts) == 4:
-                masked_id = f"{parts[0]}-{parts[1]}-XXX-{parts[3]}"
-                masked_text = masked_text.replace(eid, masked_id)
-        
-        return masked_text, detected_ids
+        detected_ids = [match.group(0) for match in PIIProtector.EMIRATES_ID_PATTERN.finditer(text)]
+        if not detected_ids:
+            return text, detected_ids
+        return PIIProtector.EMIRATES_ID_PATTERN.sub(PIIProtector._mask_emirates_id_match, text), detected_ids
     
     @staticmethod
     def mask_phone_numbers(text: str) -> Tuple[str, List[str]]:
-        detected_numbers = []
-        masked_text = text
-        
-        for pattern in PIIProtector.PHONE_PATTERNS:
-            numbers = re.findall(pattern, text)
-            detected_numbers.extend(numbers)
-            
-            for number in numbers:
-                if number.startswith('+971'):
-                    masked = f"+971-XXX-XXXX"
-                elif number.startswith('05'):
-                    masked = f"05X-XXX-XXXX"
-                else:
-                    masked = "XXX-XXX-XXXX"
-                
-                masked_text = masked_text.replace(number, masked)
-        
-        return masked_text, detected_numbers
+        detected_numbers = PIIProtector.PHONE_PATTERN.findall(text)
+        if not detected_numbers:
+            return text, detected_numbers
+        return PIIProtector.PHONE_PATTERN.sub(PIIProtector._mask_phone_match, text), detected_numbers
     
     @staticmethod
     def mask_all_pii(text: str) -> Dict[str, Any]:
@@ -105,36 +135,49 @@ class SafetyOverrideEngine:
         'police needed': {'category': 'Safety / Emergency', 'priority': 'High', 'response_time': '30 minutes'}
     }
     
+    # All keywords in one pass; the lookahead keeps overlapping hits, matching plain substring checks
+    SAFETY_KEYWORD_PATTERN = re.compile(
+        '(?=(' + '|'.join(re.escape(keyword) for keyword in SAFETY_KEYWORDS) + '))'
+    )
+    
+    # Keywords whose override escalates to Critical; they take precedence over High ones
+    CRITICAL_KEYWORDS = frozenset(
+        keyword for keyword, info in SAFETY_KEYWORDS.items() if info['priority'] == 'Critical'
+    )
+    
     SPAM_THRESHOLD = 3
     
     @staticmethod
     def check_safety_override(text: str) -> Dict[str, Any]:
-        text_lower = text.lower()
-        found_keywords = []
-        spam_score = 0
-        
-        for keyword, override_info in SafetyOverrideEngine.SAFETY_KEYWORDS.items():
-            if keyword in text_lower:
-                found_keywords.append(keyword)
-                spam_score += 1
+        return SafetyOverrideEngine.check_lowered_text(text.lower())
+    
+    @staticmethod
+    def check_lowered_text(text_lower: str) -> Dict[str, Any]:
+        """Same as check_safety_override, for callers that already hold a lowercased copy."""
+        matched = set(SafetyOverrideEngine.SAFETY_KEYWORD_PATTERN.findall(text_lower))
+        # Report in SAFETY_KEYWORDS order, one hit per keyword
+        found_keywords = [keyword for keyword in SafetyOverrideEngine.SAFETY_KEYWORDS if keyword in matched]
+        spam_score = len(found_keywords)
         
         needs_override = len(found_keywords) > 0
         is_spam = spam_score > SafetyOverrideEngine.SPAM_THRESHOLD
         
+        override_info = None
         if needs_override and not is_spam:
-            # Find most critical override
-            override_info = None
-            for keyword in found_keywords:
-                if override_info is None or SafetyOverrideEngine.SAFETY_KEYWORDS[keyword]['priority'] == 'Critical':
-                    override_info = SafetyOverrideEngine.SAFETY_KEYWORDS[keyword]
+            # Most critical override: any Critical keyword, else the first hit
+            override_keyword = next(
+                (keyword for keyword in found_keywords if keyword in SafetyOverrideEngine.CRITICAL_KEYWORDS),
+                found_keywords[0]
+            )
+            override_info = SafetyOverrideEngine.SAFETY_KEYWORDS[override_keyword]
         
         return {
             'needs_override': needs_override,
             'is_spam': is_spam,
             'found_keywords': found_keywords,
-            'override_category': override_info['category'] if needs_override and not is_spam else None,
-            'override_priority': override_info['priority'] if needs_override and not is_spam else None,
-            'response_time': override_info['response_time'] if needs_override and not is_spam else None,
+            'override_category': override_info['category'] if override_info else None,
+            'override_priority': override_info['priority'] if override_info else None,
+            'response_time': override_info['response_time'] if override_info else None,
             'spam_score': spam_score
         }
 
@@ -144,28 +187,123 @@ class TicketProcessor:
     Main ticket processing engine with clear business outputs.
     """
     
+    # Class probabilities kept per model in each result
+    TOP_K_PROBABILITIES = 3
+    
+    # Model outputs remembered per distinct masked text (duplicate complaints, retries)
+    PREDICTION_CACHE_SIZE = 10_000
+    
+    # Batches at least this large are scored in row chunks on a thread pool;
+    # below it, thread start-up costs more than it saves
+    PARALLEL_BATCH_THRESHOLD = 2048
+    PARALLEL_CHUNK_ROWS = 1024
+    
+    # Business rule tables, built once at class definition instead of per ticket
+    # Priority by category: (otherwise, when sentiment is Negative)
+    PRIORITY_RULES = {
+        'Safety / Emergency': ('High', 'Critical'),
+        'Technical / IT': ('Medium', 'High'),
+        'Billing': ('Medium', 'High'),
+        'Facilities': ('Medium', 'High'),
+        'Inquiry': ('Low', 'Medium')
+    }
+    
+    RESPONSE_TIMES = {
+        'Critical': '15 minutes',
+        'High': '1 hour',
+        'Medium': '4 hours',
+        'Low': '24 hours'
+    }
+    
+    ROUTING_MAP = {
+        'Safety / Emergency': 'Emergency Response Center',
+        'Technical / IT': 'IT Support Division',
+        'Billing': 'Finance & Accounts Department',
+        'Facilities': 'Municipal Services Department',
+        'Inquiry': 'Customer Service Center'
+    }
+    
+    # Categories routed to the Priority Escalation Team when the citizen is negative
+    ESCALATED_CATEGORIES = frozenset({'Safety / Emergency', 'Technical / IT'})
+    
+    DEPARTMENT_CONTACTS = {
+        'Emergency Response Center': {
+            'phone': '999',
+            'email': 'emergency@uae.gov.ae',
+            'supervisor': 'Col. Ahmed Al Mansoori'
+        },
+        'IT Support Division': {
+            'phone': '800-IT-HELP',
+            'email': 'itsupport@uae.gov.ae',
+            'supervisor': 'Eng. Fatima Al Zahrani'
+        },
+        'Finance & Accounts Department': {
+            'phone': '800-FINANCE',
+            'email': 'finance@uae.gov.ae',
+            'supervisor': 'Mr. Khalid Al Qasimi'
+        },
+        'Municipal Services Department': {
+            'phone': '800-MUNICIPAL',
+            'email': 'municipal@uae.gov.ae',
+            'supervisor': 'Eng. Mohammed Al Shamsi'
+        },
+        'Customer Service Center': {
+            'phone': '800-GOVERNMENT',
+            'email': 'customerservice@uae.gov.ae',
+            'supervisor': 'Ms. Sara Al Muhairi'
+        },
+        'Priority Escalation Team': {
+            'phone': '800-PRIORITY',
+            'email': 'escalation@uae.gov.ae',
+            'supervisor': 'Director General Office'
+        }
+    }
+    
+    DEFAULT_CONTACT = {
+        'phone': '800-GOVERNMENT',
+        'email': 'info@uae.gov.ae',
+        'supervisor': 'Department Head'
+    }
+    
     def __init__(self):
         self.category_model = None
         self.sentiment_model = None
+        # Classifier label arrays, cached at load time for the scoring hot path
+        self._category_classes = None
+        self._sentiment_classes = None
         self.pii_protector = PIIProtector()
         self.safety_engine = SafetyOverrideEngine()
         self.confidence_threshold = 0.55
+        # Long-lived, line-buffered audit handle (opened on first write); the lock keeps
+        # lines whole when the processor is shared across Streamlit sessions
+        self._audit_file = None
+        self._audit_lock = threading.Lock()
+        # LRU of (masked text, category override) -> frozen ml_predictions (see _freeze_prediction)
+        self._prediction_cache: 'OrderedDict[Tuple[str, Optional[str]], Tuple]' = OrderedDict()
+        self._prediction_lock = threading.Lock()
         self.load_models()
         logger.info("TicketProcessor initialized")
     
     def load_models(self):
         try:
             models_dir = Path("../models")
-            
             category_path = models_dir / "category_model.pkl"
-            if category_path.exists():
-                self.category_model = joblib.load(category_path)
-                logger.info("Category model loaded")
-            
             sentiment_path = models_dir / "sentiment_model.pkl"
-            if sentiment_path.exists():
-                self.sentiment_model = joblib.load(sentiment_path)
-                logger.info("Sentiment model loaded")
+            
+            # The two pickles are independent - load them concurrently to overlap disk I/O
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                category_future = executor.submit(load_model, category_path) if category_path.exists() else None
+                sentiment_future = executor.submit(load_model, sentiment_path) if sentiment_path.exists() else None
+                
+                if category_future is not None:
+                    self.category_model = category_future.result()
+                    self._category_classes = self.category_model.named_steps['classifier'].classes_
+                    logger.info("Category model loaded")
+                
+                if sentiment_future is not None:
+                    self.sentiment_model = sentiment_future.result()
+                    self._sentiment_classes = self.sentiment_model.named_steps['classifier'].classes_
+                    logger.info("Sentiment model loaded")
                 
         except Exception as e:
             logger.error(f"Error loading models: {e}")
@@ -217,88 +355,183 @@ class TicketProcessor:
         
         return actions
     
-    def _get_department_contact(self, department: str) -> Dict[str, str]:
+    @staticmethod
+    def _get_department_contact(department: str) -> Dict[str, str]:
         """Get department contact information."""
-        contacts = {
-            'Emergency Response Center': {
-                'phone': '999',
-                'email': 'emergency@uae.gov.ae',
-                'supervisor': 'Col. Ahmed Al Mansoori'
-            },
-            'IT Support Division': {
-                'phone': '800-IT-HELP',
-                'email': 'itsupport@uae.gov.ae',
-                'supervisor': 'Eng. Fatima Al Zahrani'
-            },
-            'Finance & Accounts Department': {
-                'phone': '800-FINANCE',
-                'email': 'finance@uae.gov.ae',
-                'supervisor': 'Mr. Khalid Al Qasimi'
-            },
-            'Municipal Services Department': {
-                'phone': '800-MUNICIPAL',
-                'email': 'municipal@uae.gov.ae',
-                'supervisor': 'Eng. Mohammed Al Shamsi'
-            },
-            'Customer Service Center': {
-                'phone': '800-GOVERNMENT',
-                'email': 'customerservice@uae.gov.ae',
-                'supervisor': 'Ms. Sara Al Muhairi'
-            },
-            'Priority Escalation Team': {
-                'phone': '800-PRIORITY',
-                'email': 'escalation@uae.gov.ae',
-                'supervisor': 'Director General Office'
-            }
-        }
-        return contacts.get(department, {
-            'phone': '800-GOVERNMENT',
-            'email': 'info@uae.gov.ae',
-            'supervisor': 'Department Head'
-        })
+        # A copy: results are handed to callers, who must not be able to edit the shared table
+        return dict(TicketProcessor.DEPARTMENT_CONTACTS.get(department, TicketProcessor.DEFAULT_CONTACT))
     
-    def process_text(self, text: str) -> Dict[str, Any]:
-        start_time = datetime.now()
-        
-        # Step 1: PII Detection
-        pii_result = self.pii_protector.mask_all_pii(text)
-        processed_text = pii_result['masked_text']
-        
-        # Step 2: Safety Check
-        safety_result = self.safety_engine.check_safety_override(processed_text)
+    @staticmethod
+    def _top_k_probabilities(classes, proba_row, k: int) -> Dict[str, float]:
+        """The k most likely classes with their probabilities, most likely first."""
+        top = proba_row.argsort()[::-1][:k]
+        return {classes[j]: float(proba_row[j]) for j in top}
+    
+    def _predict_proba(self, model: Any, texts: List[str]) -> 'np.ndarray':
+        """
+        predict_proba for one pipeline. Large batches are vectorized once, then the
+        classifier scores row chunks in threads (the sparse matmul runs in native
+        code, outside the GIL) and the chunks are stacked back in order.
+        """
+        n_chunks = min(len(texts) // self.PARALLEL_CHUNK_ROWS, os.cpu_count() or 1)
+        if len(texts) < self.PARALLEL_BATCH_THRESHOLD or n_chunks < 2:
+            return model.predict_proba(texts)
         
-        # Step 3: ML Predictions
-        ml_results = {}
-        if self.category_model and self.sentiment_model:
-            category_pred = self.category_model.predict([processed_text])[0]
-            category_proba = self.category_model.predict_proba([processed_text])
-            category_confidence = float(category_proba.max())
-            
-            sentiment_pred = self.sentiment_model.predict([processed_text])[0]
-            sentiment_proba = self.sentiment_model.predict_proba([processed_text])
-            sentiment_confidence = float(sentiment_proba.max())
-            
-            ml_results = {
-                'category': category_pred,
-                'category_confidence': category_confidence,
-                'sentiment': sentiment_pred,
-                'sentiment_confidence': sentiment_confidence,
-                'category_probabilities': dict(zip(
-                    self.category_model.named_steps['classifier'].classes_,
-                    category_proba[0]
-                )),
-                'sentiment_probabilities': dict(zip(
-                    self.sentiment_model.named_steps['classifier'].classes_,
-                    sentiment_proba[0]
-                ))
-            }
-        else:
-            ml_results = {
+        features = model.named_steps['vectorizer'].transform(texts)
+        classifier = model.named_steps['classifier']
+        bounds = np.linspace(0, features.shape[0], n_chunks + 1, dtype=int)
+        with ThreadPoolExecutor(max_workers=n_chunks) as executor:
+            chunks = executor.map(
+                classifier.predict_proba,
+                (features[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]))
+            )
+            return np.vstack(list(chunks))
+    
+    def predict_batch(self, texts: List[str],
+                      category_overrides: Optional[List[Optional[str]]] = None) -> List[Dict[str, Any]]:
+        """
+        Classify category and sentiment for a batch of (already PII-masked) texts.
+        Each model vectorizes and scores the whole batch in a single call.
+        Texts with a category override (from the safety rules) skip the category
+        model and report the override with confidence 1.0.
+        """
+        if not (self.category_model and self.sentiment_model):
+            return [{
                 'category': 'Unknown',
                 'category_confidence': 0.0,
                 'sentiment': 'Neutral',
                 'sentiment_confidence': 0.0
-            }
+            } for _ in texts]
+        
+        # One predict_proba per model; labels are the argmax class (what predict() would return)
+        category_classes = self._category_classes
+        sentiment_classes = self._sentiment_classes
+        sentiment_proba = self._predict_proba(self.sentiment_model, texts)
+        sentiment_preds = sentiment_classes[sentiment_proba.argmax(axis=1)]
+        sentiment_confidences = sentiment_proba.max(axis=1)
+        
+        # Only tickets without an override go through the category model
+        if category_overrides is None:
+            category_overrides = [None] * len(texts)
+        scored_texts = [text for text, override in zip(texts, category_overrides) if override is None]
+        category_rows = iter(self._predict_proba(self.category_model, scored_texts) if scored_texts else ())
+        
+        results = []
+        for i, override in enumerate(category_overrides):
+            if override is None:
+                proba_row = next(category_rows)
+                best = proba_row.argmax()
+                category = category_classes[best]
+                category_confidence = float(proba_row[best])
+                category_probabilities = self._top_k_probabilities(category_classes, proba_row, self.TOP_K_PROBABILITIES)
+            else:
+                category = override
+                category_confidence = 1.0
+                category_probabilities = {override: 1.0}
+            
+            results.append({
+                'category': category,
+                'category_confidence': category_confidence,
+                'sentiment': sentiment_preds[i],
+                'sentiment_confidence': float(sentiment_confidences[i]),
+                'category_probabilities': category_probabilities,
+                'sentiment_probabilities': self._top_k_probabilities(sentiment_classes, sentiment_proba[i], self.TOP_K_PROBABILITIES)
+            })
+        
+        return results
+    
+    @staticmethod
+    def _freeze_prediction(prediction: Dict[str, Any]) -> Tuple:
+        """Immutable form of a predict_batch entry, safe to share through the cache."""
+        return (
+            prediction['category'],
+            prediction['category_confidence'],
+            prediction['sentiment'],
+            prediction['sentiment_confidence'],
+            tuple(prediction['category_probabilities'].items()),
+            tuple(prediction['sentiment_probabilities'].items())
+        )
+    
+    @staticmethod
+    def _thaw_prediction(frozen: Tuple) -> Dict[str, Any]:
+        """A fresh predict_batch-style dict, so callers never hold the cached entry."""
+        category, category_confidence, sentiment, sentiment_confidence, category_probabilities, sentiment_probabilities = frozen
+        return {
+            'category': category,
+            'category_confidence': category_confidence,
+            'sentiment': sentiment,
+            'sentiment_confidence': sentiment_confidence,
+            'category_probabilities': dict(category_probabilities),
+            'sentiment_probabilities': dict(sentiment_probabilities)
+        }
+    
+    def predict_batch_cached(self, texts: List[str],
+                             category_overrides: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """
+        predict_batch with an LRU cache in front: texts seen recently reuse their
+        earlier predictions, and only the misses are scored by the models.
+        The cache holds immutable tuples; every call returns newly built dicts.
+        """
+        if not (self.category_model and self.sentiment_model):
+            return self.predict_batch(texts, category_overrides)
+        
+        keys = list(zip(texts, category_overrides))
+        cache = self._prediction_cache
+        with self._prediction_lock:
+            frozen = [cache.get(key) for key in keys]
+            for key, entry in zip(keys, frozen):
+                if entry is not None:
+                    cache.move_to_end(key)
+        
+        predictions = [self._thaw_prediction(entry) if entry is not None else None for entry in frozen]
+        misses = [i for i, entry in enumerate(frozen) if entry is None]
+        if misses:
+            fresh = self.predict_batch([texts[i] for i in misses], [category_overrides[i] for i in misses])
+            with self._prediction_lock:
+                for i, prediction in zip(misses, fresh):
+                    predictions[i] = prediction
+                    cache[keys[i]] = self._freeze_prediction(prediction)
+                while len(cache) > self.PREDICTION_CACHE_SIZE:
+                    cache.popitem(last=False)
+        
+        return predictions
+    
+    def process_text(self, text: str, confidence_threshold: Optional[float] = None) -> Dict[str, Any]:
+        return self.process_texts([text], confidence_threshold)[0]
+    
+    def process_texts(self, texts: List[str], confidence_threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Process a batch of tickets. PII masking and safety rules run per ticket,
+        while both ML models score the whole batch in a single call.
+        
+        confidence_threshold overrides the processor default for this call only, so a
+        processor shared between users never carries one user's setting into another's.
+        """
+        start_time = time.perf_counter()
+        if confidence_threshold is None:
+            confidence_threshold = self.confidence_threshold
+        
+        # Step 1: PII Detection
+        pii_results = [self.pii_protector.mask_all_pii(text) for text in texts]
+        processed_texts = [pii_result['masked_text'] for pii_result in pii_results]
+        
+        # Step 2: Safety Check (the keyword scan runs on one lowercased copy per ticket)
+        safety_results = [self.safety_engine.check_lowered_text(processed.lower()) for processed in processed_texts]
+        
+        # Step 3: ML Predictions (safety overrides already decide the category, so those skip the category model)
+        category_overrides = [safety_result['override_category'] for safety_result in safety_results]
+        ml_batch = self.predict_batch_cached(processed_texts, category_overrides) if texts else []
+        
+        return [
+            self._compile_result(text, pii_result, safety_result, ml_results, start_time, confidence_threshold)
+            for text, pii_result, safety_result, ml_results in zip(texts, pii_results, safety_results, ml_batch)
+        ]
+    
+    def _compile_result(self, text: str, pii_result: Dict[str, Any], safety_result: Dict[str, Any],
+                        ml_results: Dict[str, Any], start_time: float,
+                        confidence_threshold: float) -> Dict[str, Any]:
+        """Apply business rules to one ticket's model outputs and build its result."""
+        processed_text = pii_result['masked_text']
         
         # Step 4: Apply Safety Override
         if safety_result['needs_override'] and not safety_result['is_spam']:
@@ -314,7 +547,8 @@ class TicketProcessor:
         
         # Step 5: Confidence Check
         min_confidence = min(ml_results['category_confidence'], ml_results['sentiment_confidence'])
-        needs_manual_review = min_confidence < self.confidence_threshold or safety_result['is_spam']
+        low_confidence = min_confidence < confidence_threshold
+        needs_manual_review = low_confidence or safety_result['is_spam']
         
         # Step 6: Department Routing
         department = self._route_to_department(final_category, ml_results['sentiment'])
@@ -324,14 +558,15 @@ class TicketProcessor:
         action_items = self._get_clear_action_items(final_category, ml_results['sentiment'], final_priority)
         
         # Step 8: Compile Results
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
+        completed_at = datetime.now()
         
         results = {
             'ticket_processing': {
                 'original_text': text,
                 'processed_text': processed_text,
                 'processing_time_seconds': processing_time,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': completed_at.isoformat()
             },
             'pii_protection': pii_result,
             'safety_check': safety_result,
@@ -345,10 +580,10 @@ class TicketProcessor:
                 'response_time': response_time,
                 'confidence_score': min_confidence,
                 'needs_manual_review': needs_manual_review,
-                'manual_review_reason': 'Low confidence' if min_confidence < self.confidence_threshold else 'Potential spam' if safety_result['is_spam'] else None,
+                'manual_review_reason': 'Low confidence' if low_confidence else 'Potential spam' if safety_result['is_spam'] else None,
                 'safety_override_applied': override_applied,
                 'action_items': action_items,
-                'ticket_id': f"TKT-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{hash(text) % 10000:04d}"
+                'ticket_id': f"TKT-{completed_at:%Y%m%d-%H%M%S}-{text_digest(text) % 10000:04d}"
             }
         }
         
@@ -357,38 +592,21 @@ class TicketProcessor:
         
         return results
     
-    def _determine_priority(self, category: str, sentiment: str) -> str:
-        priority_rules = {
-            'Safety / Emergency': 'Critical' if sentiment == 'Negative' else 'High',
-            'Technical / IT': 'High' if sentiment == 'Negative' else 'Medium',
-            'Billing': 'High' if sentiment == 'Negative' else 'Medium',
-            'Facilities': 'High' if sentiment == 'Negative' else 'Medium',
-            'Inquiry': 'Medium' if sentiment == 'Negative' else 'Low'
-        }
-        return priority_rules.get(category, 'Medium')
-    
-    def _get_response_time(self, priority: str) -> str:
-        response_times = {
-            'Critical': '15 minutes',
-            'High': '1 hour',
-            'Medium': '4 hours',
-            'Low': '24 hours'
-        }
-        return response_times.get(priority, '4 hours')
-    
-    def _route_to_department(self, category: str, sentiment: str) -> str:
-        routing_map = {
-            'Safety / Emergency': 'Emergency Response Center',
-            'Technical / IT': 'IT Support Division',
-            'Billing': 'Finance & Accounts Department',
-            'Facilities': 'Municipal Services Department',
-            'Inquiry': 'Customer Service Center'
-        }
-        
-        if sentiment == 'Negative' and category in ['Safety / Emergency', 'Technical / IT']:
+    @staticmethod
+    def _determine_priority(category: str, sentiment: str) -> str:
+        rule = TicketProcessor.PRIORITY_RULES.get(category)
+        return rule[sentiment == 'Negative'] if rule else 'Medium'
+    
+    @staticmethod
+    def _get_response_time(priority: str) -> str:
+        return TicketProcessor.RESPONSE_TIMES.get(priority, '4 hours')
+    
+    @staticmethod
+    def _route_to_department(category: str, sentiment: str) -> str:
+        if sentiment == 'Negative' and category in TicketProcessor.ESCALATED_CATEGORIES:
             return 'Priority Escalation Team'
         
-        return routing_map.get(category, 'Customer Service Center')
+        return TicketProcessor.ROUTING_MAP.get(category, 'Customer Service Center')
     
     def _audit_log(self, results: Dict[str, Any]):
         try:
@@ -403,9 +621,12 @@ class TicketProcessor:
                 'processing_time': results['ticket_processing']['processing_time_seconds']
             }
             
-            log_file = Path("../logs/system_audit.log")
-            with open(log_file, 'a') as f:
-                f.write(json.dumps(audit_entry) + '\n')
+            line = json.dumps(audit_entry) + '\n'
+            with self._audit_lock:
+                if self._audit_file is None:
+                    self._audit_file = open(Path("../logs/system_audit.log"), 'a', buffering=1)
+                    atexit.register(self._audit_file.close)
+                self._audit_file.write(line)
             
         except Exception as e:
             logger.error(f"Error writing audit log: {e}")
\ No newline at end of file
@@ -3,8 +3,35 @@ Complete Bilingual Translation System for UAE Government
 نظام الترجمة الثنائية الكامل لحكومة الإمارات
 """
 
+import sys
+import json
+import hashlib
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Tuple
+
+from i18n import TranslationTable
+
+
 class TranslationSystem:
-    """Complete translation system for UAE Government application."""
+    """
+    Complete translation system for UAE Government application.
+    
+    `translate(key)` and `translate_entity(entity)` are bound per instance to
+    the active tables' `__getitem__` (which falls back to the key itself), so a
+    lookup is a single C-level call with no Python frame.
+    """
+    
+    __slots__ = ('language', 'translate', 'translate_entity', '_shared')
+    
+    VALID_LANGUAGES = frozenset(('en', 'ar'))
+    
+    # Shared instances handed out by for_language, one per language
+    _INSTANCES = {}
+    
+    # Example tickets in display order; each has '<key>' and '<key>_text' entries
+    EXAMPLE_KEYS = ('example_emergency', 'example_technical', 'example_billing',
+                    'example_positive', 'example_safety', 'example_inquiry')
     
     # Complete translation dictionary
     TRANSLATIONS = {
@@ -310,25 +337,87 @@ class TranslationSystem:
     }
     
     def __init__(self, language='en'):
-        self.language = language
+        self._shared = False
+        self.set_language(language)
     
-    def translate(self, key: str) -> str:
-        """Translate a key to the current language."""
-        return self.TRANSLATIONS.get(self.language, {}).get(key, key)
+    @classmethod
+    def for_language(cls, language: str = 'en') -> 'TranslationSystem':
+        """
+        Shared translator for a language, built once and reused by every request.
+        Prefer this over constructing a new instance per render. Shared instances
+        are read-only: set_language raises on them - ask for the other language instead.
+        """
+        language = language if language in cls.VALID_LANGUAGES else 'en'
+        instance = cls._INSTANCES.get(language)
+        if instance is None:
+            instance = cls(language)
+            instance._shared = True
+            instance = cls._INSTANCES.setdefault(language, instance)
+        return instance
     
-    def translate_entity(self, entity: str) -> str:
-        """Translate a government entity name."""
-        return self.ENTITY_TRANSLATIONS.get(self.language, {}).get(entity, entity)
+    @classmethod
+    def get_examples(cls, language: str) -> Tuple[Tuple[str, str], ...]:
+        """Example tickets as (title, text) pairs, assembled once per language."""
+        return _examples(language if language in cls.VALID_LANGUAGES else 'en')
     
     def get_bilingual(self, key: str) -> str:
         """Get bilingual text (English/Arabic)."""
-        english = self.TRANSLATIONS['en'].get(key, key)
-        arabic = self.TRANSLATIONS['ar'].get(key, key)
-        return f"{english} / {arabic}"
+        bilingual = _bilingual_table().get(key)
+        return bilingual if bilingual is not None else " / ".join((key, key))
     
     def set_language(self, language: str):
-        """Set the current language."""
-        if language in ['en', 'ar']:
-            self.language = language
-        else:
-            self.language = 'en'
\ No newline at end of file
+        """Set the current language (private instances only; see for_language)."""
+        if self._shared:
+            raise AttributeError(
+                "Shared translators are read-only; use TranslationSystem.for_language(language) instead"
+            )
+        self.language = language if language in self.VALID_LANGUAGES else 'en'
+        # Bind the lookups to the active tables once here instead of on every call
+        ui_table, entity_table = _load_tables(self.language)
+        self.translate = ui_table.__getitem__
+        self.translate_entity = entity_table.__getitem__
+
+
+# Content hash of every table, stable for a given deployment - usable as an ETag
+# or cache key for anything rendered from these translations
+TranslationSystem.VERSION_HASH = hashlib.sha256(json.dumps(
+    [TranslationSystem.TRANSLATIONS, TranslationSystem.ENTITY_TRANSLATIONS],
+    sort_keys=True, ensure_ascii=False
+).encode('utf-8')).hexdigest()[:16]
+
+# The class only exposes read-only views of its tables, so no caller can
+# mutate a shared table
+TranslationSystem.TRANSLATIONS = MappingProxyType(
+    {language: MappingProxyType(table) for language, table in TranslationSystem.TRANSLATIONS.items()}
+)
+TranslationSystem.ENTITY_TRANSLATIONS = MappingProxyType(
+    {language: MappingProxyType(table) for language, table in TranslationSystem.ENTITY_TRANSLATIONS.items()}
+)
+
+
+@lru_cache(maxsize=len(TranslationSystem.VALID_LANGUAGES))
+def _load_tables(language: str) -> Tuple[TranslationTable, TranslationTable]:
+    """
+    Build a language's (UI, entity) lookup tables the first time it is selected,
+    so English-only sessions never build the Arabic ones. Keys are interned once
+    (as i18n.load_table does) so lookups short-circuit on identity.
+    """
+    return (
+        TranslationTable((sys.intern(key), value) for key, value in TranslationSystem.TRANSLATIONS[language].items()),
+        TranslationTable((sys.intern(entity), name) for entity, name in TranslationSystem.ENTITY_TRANSLATIONS[language].items()),
+    )
+
+
+@lru_cache(maxsize=1)
+def _bilingual_table() -> Dict[str, str]:
+    """Every 'English / Arabic' label, formatted once on the first get_bilingual call."""
+    english, _ = _load_tables('en')
+    arabic, _ = _load_tables('ar')
+    return {key: f"{english[key]} / {arabic[key]}" for key in english.keys() | arabic.keys()}
+
+
+@lru_cache(maxsize=len(TranslationSystem.VALID_LANGUAGES))
+def _examples(language: str) -> Tuple[Tuple[str, str], ...]:
+    """The example-ticket (title, text) pairs for a language, looked up once."""
+    table, _ = _load_tables(language)
+    return tuple((table[key], table[f"{key}_text"]) for key in TranslationSystem.EXAMPLE_KEYS)
@@ -2,38 +2,34 @@
 Arabic language utilities for UAE Government System
 """
 
-ARABIC_TRANSLATIONS = {
-    # Categories
-    "Facilities": "المرافق",
-    "Technical / IT": "التقنية / تكنولوجيا المعلومات",
-    "Billing": "الفواتير",
-    "Inquiry": "الاستفسار",
-    "Safety / Emergency": "السلامة / الطوارئ",
-    
-    # Sentiments
-    "Positive": "إيجابي",
-    "Neutral": "محايد",
-    "Negative": "سلبي",
-    
-    # Priorities
-    "Critical": "حرج",
-    "High": "عالي",
-    "Medium": "متوسط",
-    "Low": "منخفض",
-    
-    # Departments
-    "Emergency Response Center": "مركز الاستجابة للطوارئ",
-    "IT Support Division": "قسم الدعم التقني",
-    "Finance & Accounts Department": "قسم المالية والمحاسبة",
-    "Municipal Services Department": "قسم الخدمات البلدية",
-    "Customer Service Center": "مركز خدمة العملاء",
-    "Priority Escalation Team": "فريق التصعيد ذات الأولوية",
-}
+import sys
+from typing import Iterable, List
 
-def translate_to_arabic(text: str) -> str:
-    """Translate English text to Arabic."""
-    return ARABIC_TRANSLATIONS.get(text, text)
+from i18n import TranslationTable
+from translations import TranslationSystem
+
+# Translation keys whose English values are the labels mapped below
+_LABEL_PREFIXES = ('category_', 'sentiment_', 'priority_', 'department_')
+
+# Category, sentiment, priority and department labels (English -> Arabic), derived
+# from TranslationSystem so there is a single source of truth. Keys like
+# "Technical / IT" are not identifier-shaped, so the compiler does not intern
+# them; do it here so lookups with interned labels hit on identity
+ARABIC_TRANSLATIONS = TranslationTable(
+    (sys.intern(english), TranslationSystem.TRANSLATIONS['ar'][key])
+    for key, english in TranslationSystem.TRANSLATIONS['en'].items()
+    if key.startswith(_LABEL_PREFIXES)
+)
+
+# translate_to_arabic(text) -> Arabic label, or text itself if it has none.
+# Bound straight to the table's __getitem__ (TranslationTable falls back to the
+# key), so each call is one C-level lookup with no Python frame
+translate_to_arabic = ARABIC_TRANSLATIONS.__getitem__
+
+def translate_many(texts: Iterable[str], _translate=translate_to_arabic) -> List[str]:
+    """Translate a batch of English labels (e.g. a history column) to Arabic."""
+    return [_translate(text) for text in texts]
 
 def get_bilingual_text(english: str, arabic: str) -> str:
     """Format bilingual text for display."""
-    return f"{english} / {arabic}"
\ No newline at end of file
+    return " / ".join((english, arabic))
\ No newline at end of file